@@ -4,3 +4,12 @@ from pathlib import Path
 # Path to the SQLite database file used by stores. Can be overridden
 # using the MRIEG_DB_PATH environment variable.
 DB_PATH = os.environ.get("MRIEG_DB_PATH", str(Path(__file__).parent / "db.sqlite3"))
+
+# Number of SQLite connections the game store keeps open per process.
+# Concurrent requests each check one out; WAL lets readers run in parallel.
+DB_POOL_SIZE = int(os.environ.get("MRIEG_DB_POOL_SIZE", "4"))
+
+# bcrypt cost factor used when hashing new passwords. The cost is stored in
+# each hash, so existing hashes keep verifying after this is changed. OWASP
+# recommends a cost of at least 10.
+BCRYPT_ROUNDS = int(os.environ.get("MRIEG_BCRYPT_ROUNDS", "12"))
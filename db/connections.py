@@ -3,23 +3,33 @@ from typing import Dict, Optional
 import aiosqlite
 
 
+# Applied to every connection opened by `connect`; entries in its `pragmas`
+# argument override these. Same set the stores use on their own connections.
+DEFAULT_PRAGMAS: Dict[str, str] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": "268435456",
+    "cache_size": "-65536",
+}
+
 async def connect(db_path: str, pragmas: Optional[Dict[str, str]] = None) -> aiosqlite.Connection:
     """Open an aiosqlite connection and apply sensible pragmas.
 
     - Sets `row_factory` to `aiosqlite.Row` for named access.
     - Enables foreign keys by default.
-    - Applies any additional PRAGMA settings supplied in `pragmas`.
+    - Waits up to 30s on a locked database instead of failing immediately.
+    - Applies `DEFAULT_PRAGMAS`, then any PRAGMA settings supplied in `pragmas`.
 
     Returns an open connection; caller is responsible for closing it.
     """
-    conn = await aiosqlite.connect(db_path)
+    conn = await aiosqlite.connect(db_path, timeout=30.0)
     conn.row_factory = aiosqlite.Row
 
     # Ensure foreign keys are enabled and apply additional pragmas
     await conn.execute("PRAGMA foreign_keys = ON")
-    if pragmas:
-        for k, v in pragmas.items():
-            await conn.execute(f"PRAGMA {k} = {v}")
+    for k, v in {**DEFAULT_PRAGMAS, **(pragmas or {})}.items():
+        await conn.execute(f"PRAGMA {k} = {v}")
 
     await conn.commit()
     return conn
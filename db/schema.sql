@@ -1,10 +1,12 @@
 PRAGMA foreign_keys = ON;
 
+-- Timestamps in the game tables are INTEGER unix seconds (UTC); the store
+-- renders them as ISO strings on read.
 CREATE TABLE IF NOT EXISTS games (
     game_id TEXT PRIMARY KEY,
     creator_player_id TEXT,
-    start_time DATETIME,
-    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    start_time INTEGER,
+    created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
 );
 
 CREATE TABLE IF NOT EXISTS game_settings (
@@ -13,20 +15,24 @@ CREATE TABLE IF NOT EXISTS game_settings (
     board_size INTEGER NOT NULL,
     board_shrink INTEGER NOT NULL,
     turn_interval INTEGER NOT NULL,
-    FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE
+    -- deferred: create_game inserts this row before the games row (see the
+    -- games_after_insert_check_* triggers), so the FK is checked at COMMIT
+    FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED
 );
 
 CREATE TABLE IF NOT EXISTS game_state (
     game_id TEXT PRIMARY KEY,
     turn_number INTEGER NOT NULL,
-    last_turn_time DATETIME,
-    next_turn_time DATETIME,
-    FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE
+    last_turn_time INTEGER,
+    next_turn_time INTEGER,
+    -- deferred: create_game inserts this row before the games row (see the
+    -- games_after_insert_check_* triggers), so the FK is checked at COMMIT
+    FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED
 );
 
 CREATE TABLE IF NOT EXISTS players (
     player_id TEXT PRIMARY KEY,
-    date_created DATETIME NOT NULL
+    date_created INTEGER NOT NULL
 );
 
 CREATE TABLE IF NOT EXISTS game_players (
@@ -50,10 +56,10 @@ CREATE TABLE IF NOT EXISTS pieces (
     vy REAL NOT NULL,
     radius REAL NOT NULL,
     mass REAL NOT NULL,
-    PRIMARY KEY (piece_id, game_id),
+    PRIMARY KEY (game_id, piece_id),
     FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE,
     FOREIGN KEY (owner_player_id) REFERENCES players(player_id) ON DELETE SET NULL
-);
+) WITHOUT ROWID; -- clustered by game: a game's pieces are one contiguous range of the table
 
 CREATE TABLE IF NOT EXISTS pieces_old (
     piece_id TEXT,
@@ -65,10 +71,10 @@ CREATE TABLE IF NOT EXISTS pieces_old (
     vy REAL NOT NULL,
     radius REAL NOT NULL,
     mass REAL NOT NULL,
-    PRIMARY KEY (piece_id, game_id),
+    PRIMARY KEY (game_id, piece_id),
     FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE,
     FOREIGN KEY (owner_player_id) REFERENCES players(player_id) ON DELETE SET NULL
-);
+) WITHOUT ROWID; -- clustered by game, like pieces
 
 CREATE TABLE IF NOT EXISTS game_passwords (
     game_id TEXT PRIMARY KEY,
@@ -88,25 +94,48 @@ CREATE TABLE IF NOT EXISTS session_tokens (
     session_token TEXT PRIMARY KEY,
     game_id TEXT,
     player_id TEXT,
-    expires_at DATETIME NOT NULL,
+    expires_at INTEGER NOT NULL, -- unix seconds (UTC)
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE,
     FOREIGN KEY (player_id) REFERENCES players(player_id) ON DELETE CASCADE
-);
+) WITHOUT ROWID; -- clustered on session_token: token lookups are a single b-tree search
 
 CREATE INDEX IF NOT EXISTS idx_game_players_game ON game_players(game_id);
-CREATE INDEX IF NOT EXISTS idx_pieces_game ON pieces(game_id);
-CREATE INDEX IF NOT EXISTS idx_sessions_expiry ON session_tokens(expires_at);
+-- player_id lookups: delete_stale_players' NOT EXISTS probe and the players -> game_players cascade
+CREATE INDEX IF NOT EXISTS idx_game_players_player ON game_players(player_id);
+CREATE INDEX IF NOT EXISTS idx_sessions_expiry ON session_tokens(expires_at); -- also carries session_token, so expiry sweeps stay in the index
+-- delete_stale_games / delete_stale_players pick each batch by age; without
+-- these every batch rescans the whole table.
+CREATE INDEX IF NOT EXISTS idx_games_created_at ON games(created_at);
+CREATE INDEX IF NOT EXISTS idx_players_date_created ON players(date_created);
 
 -- Pool of suggested, unused game ids. Applications should `SELECT` and
 -- optionally set `leased_until` as a short reservation when recommending
 -- a name to a client; the lease prevents immediate re-recommendation.
 CREATE TABLE IF NOT EXISTS unused_game_ids (
     name TEXT PRIMARY KEY,
-    leased_until DATETIME,
-    last_refreshed DATETIME --the time this id was last confirmed as unused
+    leased_until INTEGER,
+    last_refreshed INTEGER --the time this id was last confirmed as unused
+);
+
+-- list_unused_game_ids / reserve_unused_game_id walk this backwards and stop
+-- after LIMIT available rows instead of sorting the whole pool.
+CREATE INDEX IF NOT EXISTS idx_unused_game_ids_refreshed ON unused_game_ids(last_refreshed);
+
+-- Outbox of scheduled turns: start_game / advance_turn_if_ready write the
+-- game's next turn here in the same transaction that sets next_turn_time, and
+-- the dispatch_due_turns beat task enqueues run_turn once it is due. One row
+-- per game; scheduling a later turn replaces it.
+CREATE TABLE IF NOT EXISTS due_turns (
+    game_id TEXT PRIMARY KEY,
+    turn_number INTEGER NOT NULL,
+    run_at INTEGER NOT NULL, -- unix seconds
+    claimed_at INTEGER, -- set while a dispatcher is enqueueing it
+    FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE
 );
 
+CREATE INDEX IF NOT EXISTS idx_due_turns_run_at ON due_turns(run_at);
+
 -- Prevent inserting a suggested id that already exists as a real game id.
 CREATE TRIGGER IF NOT EXISTS unused_game_ids_before_insert
 BEFORE INSERT ON unused_game_ids
@@ -19,7 +19,7 @@ from routes import players as players_routes
 from routes import auth as auth_routes
 from routes import debug as debug_routes
 from routes import nongame as nongame_routes
-from stores import init_stores
+from stores import init_stores_async
 import config
 import logging
 
@@ -69,7 +69,7 @@ app.include_router(debug_routes.router, prefix="/games")
 @app.on_event("startup")
 async def startup_event():
 	# Initialize shared store singletons for this process
-	init_stores(config.DB_PATH)
+	await init_stores_async(config.DB_PATH)
 
 
 @app.get("/healthz")
@@ -4,17 +4,53 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-import secrets
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import base64
+import os
 import bcrypt
 import logging
 
+import config
 from stores import get_auth_store, GameNotFound, PlayerNotFound, SessionNotFound
 
 logger = logging.getLogger(__name__)
 
+TORONTO_TZ = ZoneInfo("America/Toronto")
+
 router = APIRouter()
 
 
+class _TokenPool:
+	"""Hand out url-safe session tokens sliced from a shared urandom buffer.
+
+	Reads `refill_bytes` from the OS at a time instead of one syscall per
+	token. Slicing never awaits, so it is safe to share within an event loop.
+	"""
+
+	def __init__(self, token_bytes: int = 32, refill_bytes: int = 4096):
+		self.token_bytes = token_bytes
+		self.refill_bytes = refill_bytes
+		self._buf = b""
+		self._pos = 0
+
+	def next(self) -> str:
+		if self._pos + self.token_bytes > len(self._buf):
+			self._buf = os.urandom(self.refill_bytes)
+			self._pos = 0
+		chunk = self._buf[self._pos:self._pos + self.token_bytes]
+		self._pos += self.token_bytes
+		return base64.urlsafe_b64encode(chunk).rstrip(b"=").decode("ascii")
+
+
+_token_pool = _TokenPool()
+
+
+def _new_session_token() -> str:
+	"""Return a fresh session token (same format as `secrets.token_urlsafe(32)`)."""
+	return _token_pool.next()
+
+
 class AuthRequest(BaseModel):
 	game_id: Optional[str] = None
 	game_password: Optional[str] = None
@@ -24,14 +60,28 @@ class AuthRequest(BaseModel):
 
 def _hash_password(password: str) -> tuple[bytes, bytes]:
 	"""Hash a password using bcrypt and return (salt, hashed)."""
-	# bcrypt.gensalt() generates a salt with default cost factor of 12
+	# bcrypt.gensalt() generates a salt with the configured cost factor (default 12)
 	# bcrypt.hashpw() handles both salt generation and hashing
-	salt = bcrypt.gensalt(rounds=12)
+	# bcrypt>=4 is the Rust (PyO3) implementation, so there is no faster native
+	# backend to swap in; it also releases the GIL while hashing.
+	salt = bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS)
 	hashed = bcrypt.hashpw(password.encode(), salt)
 	# bcrypt stores salt within hashed, but return both for consistency
 	return salt, hashed
 
 
+# Dedicated pool for password hashing. bcrypt releases the GIL, so hashes run
+# in parallel across cores on threads; keeping them off the default executor
+# stops a burst of signups from starving other asyncio.to_thread callers.
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
+
+async def _hash_password_async(password: str) -> tuple[bytes, bytes]:
+	"""Run `_hash_password` on the dedicated hashing pool."""
+	loop = asyncio.get_running_loop()
+	return await loop.run_in_executor(_hash_executor, _hash_password, password)
+
+
 def _verify_password(password: str, salt: bytes, hashed: bytes) -> bool:
 	"""Verify a password against bcrypt hash."""
 	# bcrypt.checkpw compares plaintext against the hashed value
@@ -42,6 +92,34 @@ def _verify_password(password: str, salt: bytes, hashed: bytes) -> bool:
 		return False
 
 
+def _make_dummy_hash() -> bytes:
+	"""A bcrypt hash at the current cost that no stored password maps to."""
+	return bcrypt.hashpw(os.urandom(16), bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS))
+
+
+# Built once per process on the hashing pool as soon as the module loads, so it
+# never runs on the event loop and is normally ready before the first lookup;
+# an unknown ID then costs one checkpw, the same as a wrong password.
+_dummy_hash = _hash_executor.submit(_make_dummy_hash)
+
+
+async def _check_password(password: str, salt_hash: tuple[bytes, bytes] | None) -> bool:
+	"""Verify `password` against a stored (salt, hashed) pair on the hashing pool.
+
+	All credential checks go through here. When no password is stored the
+	candidate is still checked against a dummy hash, so an unknown game/player
+	costs the same bcrypt work as a wrong password and response time does not
+	reveal which IDs exist. bcrypt.checkpw itself compares in constant time.
+	"""
+	if salt_hash:
+		salt, hashed = salt_hash
+	else:
+		salt, hashed = b"", await asyncio.wrap_future(_dummy_hash)
+	loop = asyncio.get_running_loop()
+	ok = await loop.run_in_executor(_hash_executor, _verify_password, password, salt, hashed)
+	return ok and salt_hash is not None
+
+
 def _append_cookie(response: JSONResponse, key: str, value: str, expires: int = 2 * 24 * 60 * 60):
 	"""Attach a cookie to the response."""
 	response.set_cookie(key=key, value=value, httponly=False, expires=expires)
@@ -59,8 +137,8 @@ async def create_session_and_append_cookies(response: JSONResponse, auth_store,
 		ValueError: if both game_id and player_id are None
 		HTTPException: if token creation fails (500)
 	"""
-	session_token = secrets.token_urlsafe(32)
-	expires_at = datetime.now(ZoneInfo("America/Toronto")) + timedelta(days=expires_days)
+	session_token = _new_session_token()
+	expires_at = datetime.now(TORONTO_TZ) + timedelta(days=expires_days)
 	try:
 		await auth_store.create_session_token(
 			session_token,
@@ -92,25 +170,19 @@ async def request_token(req: AuthRequest, auth_store = Depends(get_auth_store)):
 	# Validate game password if provided
 	if req.game_id and req.game_password:
 		salt_hash = await auth_store.get_game_password(req.game_id)
-		if not salt_hash:
-			return JSONResponse({"error": "Invalid game credentials"}, status_code=403)
-		salt, hashed = salt_hash
-		if not _verify_password(req.game_password, salt, hashed):
+		if not await _check_password(req.game_password, salt_hash):
 			return JSONResponse({"error": "Invalid game credentials"}, status_code=403)
 	
 	# Validate player password if provided
 	if req.player_id and req.player_password:
 		salt_hash = await auth_store.get_player_password(req.player_id)
-		if not salt_hash:
-			return JSONResponse({"error": "Invalid player credentials"}, status_code=403)
-		salt, hashed = salt_hash
-		if not _verify_password(req.player_password, salt, hashed):
+		if not await _check_password(req.player_password, salt_hash):
 			return JSONResponse({"error": "Invalid player credentials"}, status_code=403)
 	
 	# Create session token
 	try:
-		session_token = secrets.token_urlsafe(32)
-		expires_at = datetime.now(ZoneInfo("America/Toronto")) + timedelta(days=2)
+		session_token = _new_session_token()
+		expires_at = datetime.now(TORONTO_TZ) + timedelta(days=2)
 		await auth_store.create_session_token(
 			session_token,
 			game_id=req.game_id,
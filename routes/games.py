@@ -2,7 +2,6 @@ from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import JSONResponse, HTMLResponse
 from workers.tasks import start_game as start_game_task
 import bcrypt
-import os
 import logging
 
 from models import (
@@ -26,7 +25,7 @@ from stores import (
 )
 from utils.cookies import check_credentials, UnauthorizedException
 from utils.validation import is_valid_name
-from .auth import create_session_and_append_cookies, _hash_password
+from .auth import create_session_and_append_cookies, _hash_password_async
 from . import games_helpers
 
 logger = logging.getLogger(__name__)
@@ -95,7 +94,7 @@ async def create_game(request: Request, req: CreateGameRequest, store = Depends(
 		logger.info(f"Creating game {req.game_id}")
         
 		# Hash password and create game with settings from request (and password)
-		salt, hashed = _hash_password(req.password)
+		salt, hashed = await _hash_password_async(req.password)
 
 		# Store layer: persist game to database, returns scheduled start_time
 		start_time = await store.create_game(
@@ -112,13 +111,13 @@ async def create_game(request: Request, req: CreateGameRequest, store = Depends(
 
 		# Infrastructure layer: schedule background task using the start_time from store
 		try:
-			# Explicitly pass broker URL to ensure it uses the correct Redis service
-			broker_url = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
+			# Uses the broker configured on the shared Celery app (CELERY_BROKER_URL)
+			# so the pooled connection is reused; fail fast instead of retrying.
 			start_game_task.apply_async(
-				args=[req.game_id],  
+				args=[req.game_id],
 				eta=start_time,
 				ignore_result=True,
-				broker=broker_url
+				retry=False,
 			)
 			logger.info(f"Scheduled start_game task for {req.game_id} at {start_time}")
 		except Exception as exc:
@@ -5,7 +5,6 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-import secrets
 import logging
 
 from stores import (
@@ -19,11 +18,13 @@ from stores import (
 )
 from models import BaseModelPlus
 from utils.cookies import check_credentials
-from .auth import _hash_password, _append_cookie
+from .auth import _hash_password_async, _append_cookie, _new_session_token
 from utils.validation import is_valid_name
 
 logger = logging.getLogger(__name__)
 
+TORONTO_TZ = ZoneInfo("America/Toronto")
+
 router = APIRouter()
 
 
@@ -43,8 +44,9 @@ async def create_player(req: CreatePlayerRequest, game_store = Depends(get_game_
 		raise HTTPException(status_code=400, detail="Invalid player ID format. (Use only letters, numbers, spaces, and .'-`’· characters.)")
 
 	"""Create a new player and return session cookie."""
-	# Hash password first so we can pass it into the store for atomic creation
-	player_salt, player_hashed = _hash_password(req.password)
+	# Hash password first so we can pass it into the store for atomic creation.
+	# bcrypt is CPU-bound, so run it on the hashing pool to keep the event loop free.
+	player_salt, player_hashed = await _hash_password_async(req.password)
 	try:
 		await game_store.create_player(req.player_id, player_salt=player_salt, player_hashed=player_hashed)
 	except PlayerAlreadyExists:
@@ -59,8 +61,8 @@ async def create_player(req: CreatePlayerRequest, game_store = Depends(get_game_
 
 	# Create session token
 	try:
-		session_token = secrets.token_urlsafe(32)
-		expires_at = datetime.now(ZoneInfo("America/Toronto")) + timedelta(days=2)
+		session_token = _new_session_token()
+		expires_at = datetime.now(TORONTO_TZ) + timedelta(days=2)
 		await auth_store.create_session_token(
 			session_token,
 			game_id=None,
@@ -85,28 +87,30 @@ async def register_for_game(request: Request, req: CreatePlayerAndJoinGameReques
 		raise HTTPException(status_code=401, detail="Invalid or unauthenticated game ID")
 
 	"""Create a new player and join an existing game."""
-	# Hash password first so we can pass it into the store for atomic creation
-	salt, hashed = _hash_password(req.password)
+	# Hash password first so we can pass it into the store for atomic creation.
+	# bcrypt is CPU-bound, so run it on the hashing pool to keep the event loop free.
+	salt, hashed = await _hash_password_async(req.password)
+	session_token = _new_session_token()
+	expires_at = datetime.now(TORONTO_TZ) + timedelta(days=2)
+
+	# Create the player, join the game and store the session in one transaction
 	try:
-		await game_store.create_player(req.player_id, player_salt=salt, player_hashed=hashed)
+		await game_store.register_player_and_join(
+			game_id,
+			req.player_id,
+			name=req.player_id,
+			color=None,
+			player_salt=salt,
+			player_hashed=hashed,
+			session_token=session_token,
+			expires_at=expires_at,
+		)
 	except PlayerAlreadyExists:
 		logger.warning(f"Attempt to register player with existing ID: {req.player_id}")
 		return JSONResponse({"error": "Player ID already exists"}, status_code=400)
 	except PasswordAlreadyExists:
 		logger.warning(f"Attempt to register player with existing password: {req.player_id}")
 		return JSONResponse({"error": "Player password already registered"}, status_code=400)
-	except Exception as e:
-		logger.error(f"Failed to create player: {e}", exc_info=True)
-		return JSONResponse({"error": str(e)}, status_code=500)
-	
-	# Try to join game
-	try:
-		await game_store.add_player_to_game(
-			game_id,
-			req.player_id,
-			name=req.player_id,
-			color=None,
-		)
 	except GameNotFound:
 		logger.warning(f"Attempt to join non-existent game: {game_id}")
 		return JSONResponse({"error": "Game not found"}, status_code=404)
@@ -117,24 +121,9 @@ async def register_for_game(request: Request, req: CreatePlayerAndJoinGameReques
 		logger.info(f"Attempt to join full game: {game_id}")
 		return JSONResponse({"error": "Game is full"}, status_code=400)
 	except Exception as e:
-		logger.error(f"Failed to add player to game: {e}", exc_info=True)
+		logger.error(f"Failed to register player for game: {e}", exc_info=True)
 		return JSONResponse({"error": str(e)}, status_code=500)
-		
-	
-	# Create session token
-	try:
-		session_token = secrets.token_urlsafe(32)
-		expires_at = datetime.now(ZoneInfo("America/Toronto")) + timedelta(days=2)
-		await auth_store.create_session_token(
-			session_token,
-			game_id=game_id,
-			player_id=req.player_id,
-			expires_at=expires_at,
-		)
-	except Exception as e:
-		logger.error(f"Failed to create session token: {e}", exc_info=True)
-		raise HTTPException(status_code=500, detail="Failed to create session token")
-	
+
 	output = JSONResponse({
 		"message": "Player created and joined game successfully",
 		"player_id": req.player_id,
@@ -5,6 +5,19 @@ import sys
 import os
 from pathlib import Path
 
+def load_schema(conn: sqlite3.Connection, schema_path: Path) -> None:
+    """Execute the statements in `schema_path` one by one as they are read."""
+    statement = ""
+    with open(schema_path, encoding="utf-8") as f:
+        for line in f:
+            statement += line
+            if sqlite3.complete_statement(statement):
+                conn.execute(statement)
+                statement = ""
+    if statement.strip():
+        conn.execute(statement)
+
+
 def init_db(db_path: str, schema_path: str) -> None:
     """Initialize SQLite database from schema file."""
     db_path = Path(db_path).resolve()
@@ -18,17 +31,31 @@ def init_db(db_path: str, schema_path: str) -> None:
         # Connect and initialize database
         conn = sqlite3.connect(str(db_path))
         cursor = conn.cursor()
+
+        # journal_mode=WAL is persisted in the database file, so every later
+        # connection (API, workers, beat) opens in WAL. The remaining pragmas
+        # are per-connection and only speed up this initialization run.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
         
-        # Drop all existing tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        # Drop all existing tables in one script (one transaction, one fsync).
+        # The file itself is kept rather than unlinked: workers sharing the
+        # volume may still hold it open. sqlite_* tables cannot be dropped.
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
         existing_tables = [t[0] for t in cursor.fetchall()]
-        for table in existing_tables:
-            cursor.execute(f"DROP TABLE IF EXISTS {table}")
-        conn.commit()
+        if existing_tables:
+            drops = "\n".join(
+                'DROP TABLE IF EXISTS "{}";'.format(t.replace('"', '""')) for t in existing_tables
+            )
+            conn.executescript(f"BEGIN;\n{drops}\nCOMMIT;")
         
-        # Load and execute schema
-        sql = schema_path.read_text()
-        conn.executescript(sql)
+        # Load and execute schema one statement at a time, so only the current
+        # statement is held in memory. complete_statement() keeps trigger
+        # bodies (BEGIN ... END) together.
+        load_schema(conn, schema_path)
         conn.commit()
         
         # Verify critical tables exist
@@ -14,7 +14,8 @@ export MRIEG_DB_PATH="${MRIEG_DB_PATH:-./dev.db}"
 CONCURRENCY=$(nproc)
 
 # start a worker that listens to the configured queues
+# (maintenance_heavy / maintenance_light can instead go to separate workers with their own -c)
 exec celery -A workers.celery_app worker \
   --loglevel=info \
-  -Q game_turns,game_management,maintenance \
+  -Q game_turns,game_management,maintenance_heavy,maintenance_light \
   -c "$CONCURRENCY"
\ No newline at end of file
@@ -1,12 +1,17 @@
 # game_simulation.py
-import json
 import subprocess
+import orjson
 from datetime import datetime
 import zoneinfo
 import random
 import math
 import shutil
+import functools
 import os
+import select
+import threading
+import time
+import atexit
 import logging
 from typing import Any, Dict
 
@@ -29,6 +34,12 @@ DEFAULT_BOARD_SHRINK = 50
 DEFAULT_RADIUS = 30
 DEFAULT_MASS = 1
 
+# Resolved once at import; GAME_TIMEZONE falls back to UTC if it is not a valid zone.
+try:
+    _GAME_TZ = zoneinfo.ZoneInfo(os.environ.get("GAME_TIMEZONE", "America/Toronto"))
+except Exception:
+    _GAME_TZ = zoneinfo.ZoneInfo("UTC")
+
 
 # --- Helper: advance simulation ---
 # only updates game["state"]["pieces"] based on existing vx/vy in those fields
@@ -57,11 +68,7 @@ def advance_simulation(game):
 
     game["state"]["pieces"] = new_state.get("pieces", []) + pieces_before_out
     game["state"]["turn_number"] += 1
-    try:
-        tz = zoneinfo.ZoneInfo(os.environ.get("GAME_TIMEZONE", "America/Toronto"))
-    except Exception:
-        tz = zoneinfo.ZoneInfo("UTC")
-    game["state"]["last_turn_time"] = datetime.now(tz)
+    game["state"]["last_turn_time"] = datetime.now(_GAME_TZ)
     game["settings"]["board_size"] -= board_shrink
     
     for player in game["players"]:
@@ -98,28 +105,161 @@ def _sanitize_obj(obj, depth=0, max_depth=10):
         raise ValueError("Unsupported value type in input")
 
 
-def run_js_simulation(pieces, board_before=DEFAULT_BOARD_SIZE, board_after=DEFAULT_BOARD_SIZE - DEFAULT_BOARD_SHRINK, *,
-                      max_input_bytes=200_000, timeout_s=10):
-    logger.debug("running simulation: board %s -> %s (pieces=%d)", board_before, board_after, len(pieces) if isinstance(pieces, list) else 0)
-    # Basic validation / sanitization of pieces
+_DISALLOWED_KEYS = frozenset(("__proto__", "prototype", "constructor"))
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _sanitize_pieces(pieces):
+    """Validate a list of flat piece dicts in a single pass.
+
+    Pieces only ever hold scalar fields, so this is the non-recursive fast
+    path of `_sanitize_obj` used for simulation input and output each turn.
+    Returns shallow copies; raises ValueError on anything suspicious.
+    """
     if not isinstance(pieces, list):
         raise ValueError("pieces must be a list")
-    # sanitize each piece (will raise if suspicious)
-    try:
-        safe_pieces = _sanitize_obj(pieces)
-    except ValueError as e:
-        raise RuntimeError(f"Invalid simulation input: {e}")
+    clean = []
+    for p in pieces:
+        if not isinstance(p, dict):
+            raise ValueError("piece must be an object")
+        for k, v in p.items():
+            if not isinstance(k, str):
+                raise ValueError("Invalid key type")
+            if k in _DISALLOWED_KEYS:
+                raise ValueError(f"Disallowed key: {k}")
+            if not isinstance(v, _SCALAR_TYPES):
+                raise ValueError("Unsupported value type in input")
+        clean.append(dict(p))
+    return clean
 
-    input_data = {
-        "pieces": safe_pieces,
-        "boardBefore": int(board_before),
-        "boardAfter": int(board_after),
-    }
 
-    raw = json.dumps(input_data)
-    if len(raw.encode("utf-8")) > max_input_bytes:
-        raise RuntimeError("Input too large")
+class _SimulationSidecar:
+    """A long-lived `node headless.mjs --server` process.
+
+    Each request is one line of JSON on stdin and each response one line of
+    JSON on stdout, so Node startup and JIT warmup are paid once per process
+    instead of once per turn. Requests are serialized with a lock; on timeout
+    or a broken pipe the process is killed and restarted on the next call.
+
+    The pipes are driven through their raw fds against a deadline, never the
+    buffered file objects, so a half-written line (or a stalled reader) can't
+    block past the timeout.
+    """
 
+    def __init__(self, node_path: str, script_path: str):
+        self.cmd = [node_path, script_path, "--server"]
+        self._proc = None
+        self._pid = None  # owning Python process; never reuse pipes across fork()
+        self._lock = threading.Lock()
+        self._buf = bytearray()  # stdout bytes read but not yet returned
+
+    def _ensure_started(self):
+        if self._proc is not None and self._proc.poll() is None and self._pid == os.getpid():
+            return
+        if self._proc is not None and self._pid != os.getpid():
+            # Inherited from the parent across fork(); drop our copies of its pipes.
+            self._proc.stdin.close()
+            self._proc.stdout.close()
+        env = os.environ.copy()
+        env["NODE_ENV"] = env.get("NODE_ENV", "production")
+        logger.debug("starting simulation sidecar: %s", self.cmd)
+        self._proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+        self._pid = os.getpid()
+        self._buf = bytearray()
+
+    def stop(self):
+        proc, self._proc = self._proc, None
+        if proc is not None and self._pid == os.getpid() and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    def _write_all(self, data: bytes, deadline: float) -> bool:
+        """Write `data` to stdin; False if `deadline` passes first."""
+        fd = self._proc.stdin.fileno()
+        view = memoryview(data)
+        while view:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _, ready, _ = select.select([], [fd], [], remaining)
+            if not ready:
+                return False
+            # select only promises PIPE_BUF bytes of room; larger writes may block
+            view = view[os.write(fd, view[:select.PIPE_BUF]):]
+        return True
+
+    def _read_line(self, deadline: float) -> bytes | None:
+        """Read one response line from stdout.
+
+        Returns None if `deadline` passes first and b"" if the process closed
+        stdout before finishing a line.
+        """
+        fd = self._proc.stdout.fileno()
+        while True:
+            end = self._buf.find(b"\n")
+            if end >= 0:
+                line = bytes(self._buf[:end + 1])
+                del self._buf[:end + 1]
+                return line
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b""
+            self._buf += chunk
+
+    def request(self, raw: bytes, timeout_s: float) -> bytes:
+        with self._lock:
+            self._ensure_started()
+            deadline = time.monotonic() + timeout_s
+            try:
+                line = self._read_line(deadline) if self._write_all(raw + b"\n", deadline) else None
+            except OSError as e:
+                self.stop()
+                raise RuntimeError(f"JavaScript simulation failed: {e}") from e
+            if line is None:
+                self.stop()
+                raise RuntimeError(f"JavaScript simulation timed out after {timeout_s}s")
+            if not line:
+                self.stop()
+                raise RuntimeError("JavaScript simulation process exited unexpectedly")
+            return line
+
+
+_sidecar = None
+
+
+def _get_sidecar(node_path: str, script_path: str) -> _SimulationSidecar:
+    global _sidecar
+    cmd = [node_path, script_path, "--server"]
+    if _sidecar is None or _sidecar.cmd != cmd:
+        if _sidecar is not None:
+            _sidecar.stop()
+        _sidecar = _SimulationSidecar(node_path, script_path)
+    return _sidecar
+
+
+@atexit.register
+def _stop_sidecar():
+    if _sidecar is not None:
+        _sidecar.stop()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_node_and_script() -> tuple[str, str]:
+    """Locate the node executable and headless script once per process.
+
+    Raises RuntimeError if either cannot be found (failures are not cached).
+    """
     # Resolve node executable: allow env override, prefer `node`, then `nodejs`.
     node_exec = os.environ.get("NODE_EXECUTABLE") or "node"
     node_path = shutil.which(node_exec) or shutil.which("nodejs")
@@ -147,37 +287,52 @@ def run_js_simulation(pieces, board_before=DEFAULT_BOARD_SIZE, board_after=DEFAU
         logger.error("headless script not found; checked HEADLESS_SCRIPT=%s and candidates", script_path)
         raise RuntimeError(f"headless script not found (looked at: {script_path})")
 
-    # Use the current environment but ensure NODE_ENV is set for the child
-    env = os.environ.copy()
-    env["NODE_ENV"] = env.get("NODE_ENV", "production")
-    logger.debug("running headless script: %s", script_path)
+    return node_path, script_path
 
-    proc = subprocess.run(
-        [node_path, script_path],
-        input=raw,
-        capture_output=True,
-        text=True,
-        timeout=timeout_s,
-        env=env
-    )
-    logger.debug("finished running headless script (returncode=%s)", proc.returncode)
-    
-    
 
-    if proc.returncode != 0:
-        # include stderr for debugging
-        logger.error("simulation failed: stdout=%s stderr=%s", proc.stdout, proc.stderr)
-        raise RuntimeError(f"JavaScript simulation failed: {proc.stderr}")
+def run_js_simulation(pieces, board_before=DEFAULT_BOARD_SIZE, board_after=DEFAULT_BOARD_SIZE - DEFAULT_BOARD_SHRINK, *,
+                      max_input_bytes=200_000, timeout_s=10):
+    logger.debug("running simulation: board %s -> %s (pieces=%d)", board_before, board_after, len(pieces) if isinstance(pieces, list) else 0)
+    # Basic validation / sanitization of pieces
+    if not isinstance(pieces, list):
+        raise ValueError("pieces must be a list")
+    # sanitize each piece (will raise if suspicious)
+    try:
+        safe_pieces = _sanitize_pieces(pieces)
+    except ValueError as e:
+        raise RuntimeError(f"Invalid simulation input: {e}")
+
+    input_data = {
+        "pieces": safe_pieces,
+        "boardBefore": int(board_before),
+        "boardAfter": int(board_after),
+    }
+
+    # orjson serializes straight to UTF-8 bytes, which go to the pipe as-is
+    raw = orjson.dumps(input_data)
+    if len(raw) > max_input_bytes:
+        raise RuntimeError("Input too large")
+
+    node_path, script_path = _resolve_node_and_script()
+    logger.debug("running headless script: %s", script_path)
+    out = _get_sidecar(node_path, script_path).request(raw, timeout_s)
+    logger.debug("finished running headless script")
 
     # parse and sanitize returned JSON as well (optional but recommended)
-    parsed = json.loads(proc.stdout)
+    parsed = orjson.loads(out)
     # Expect the returned structure; sanitize before using
     if not isinstance(parsed, dict):
         raise RuntimeError("Unexpected simulation output")
+    if "error" in parsed:
+        logger.error("simulation failed: %s", parsed["error"])
+        raise RuntimeError(f"JavaScript simulation failed: {parsed['error']}")
 
     # If the JS returns a `pieces` key, use it directly (legacy/explicit API).
     if "pieces" in parsed:
-        parsed["pieces"] = _sanitize_obj(parsed["pieces"])
+        try:
+            parsed["pieces"] = _sanitize_pieces(parsed["pieces"])
+        except ValueError as e:
+            raise RuntimeError(f"Unexpected simulation output: {e}")
         return parsed
 
     # Some JS runner implementations (like headless.mjs) return `survivors`
@@ -188,18 +343,22 @@ def run_js_simulation(pieces, board_before=DEFAULT_BOARD_SIZE, board_after=DEFAU
         if not isinstance(survivors, list):
             raise RuntimeError("Unexpected simulation output: survivors must be a list")
 
+        # headless.mjs coerces pieceid with Number(), so key on the string form
+        # to match "1" in the input against 1 in the output.
+        by_id = {str(p.get("pieceid")): p for p in safe_pieces}
+
         new_pieces = []
         for i, s in enumerate(survivors):
             if not isinstance(s, dict):
                 raise RuntimeError("Unexpected simulation output: survivor entry not an object")
 
-            # Preserve owner (and any other original keys) by indexing into the
-            # input pieces we sent to the JS runner (safe_pieces).
-            owner = None
-            orig = None
-            if i < len(safe_pieces) and isinstance(safe_pieces[i], dict):
+            # Preserve owner (and any other original keys) by looking up the
+            # input piece we sent to the JS runner; fall back to its position
+            # for runners that do not echo pieceid.
+            orig = by_id.get(str(s.get("pieceid")))
+            if orig is None and i < len(safe_pieces):
                 orig = safe_pieces[i]
-                owner = orig.get("owner")
+            owner = orig.get("owner") if orig else None
 
             piece = {
                 "owner": owner,
@@ -209,6 +368,11 @@ def run_js_simulation(pieces, board_before=DEFAULT_BOARD_SIZE, board_after=DEFAU
                 "vx": s.get("vx"),
                 "vy": s.get("vy"),
             }
+            # Keys are ours and owner came from the sanitized input, so only the
+            # values copied out of the JS output need a type check.
+            for k in ("pieceid", "x", "y", "vx", "vy"):
+                if not isinstance(piece[k], _SCALAR_TYPES):
+                    raise RuntimeError(f"Unexpected simulation output: invalid {k}")
             # carry through color if provided by JS or original
             color = s.get("color") if isinstance(s.get("color"), str) else None
             if not color and orig and isinstance(orig.get("color"), str):
@@ -216,8 +380,7 @@ def run_js_simulation(pieces, board_before=DEFAULT_BOARD_SIZE, board_after=DEFAU
             if color:
                 piece["color"] = color
 
-            # sanitize each produced piece before adding
-            new_pieces.append(_sanitize_obj(piece))
+            new_pieces.append(piece)
 
         return {"pieces": new_pieces, "steps": parsed.get("steps")}
 
@@ -234,7 +397,7 @@ async def simulate_and_replace(game_store: "GameStore", game_id: str, owner: str
     """Run the JS simulation against current pieces and replace pieces.
 
     This function will:
-    - load current pieces and settings
+    - load current pieces, settings and turn number in one read
     - run `run_js_simulation` to compute new pieces
     - call `game_store.replace_pieces` to atomically store new pieces
 
@@ -256,8 +419,9 @@ async def simulate_and_replace(game_store: "GameStore", game_id: str, owner: str
         Exception: if pieces replacement fails
     """
     try:
-        settings = await game_store.get_game_settings(game_id)
-        pieces = await game_store.get_pieces(game_id)
+        snapshot = await game_store.get_game_snapshot(game_id)
+        settings = snapshot["settings"]
+        pieces = snapshot["pieces"]
 
         board_before = int(settings.get("board_size", DEFAULT_BOARD_SIZE))
         board_shrink = int(settings.get("board_shrink", DEFAULT_BOARD_SHRINK))
@@ -273,12 +437,11 @@ async def simulate_and_replace(game_store: "GameStore", game_id: str, owner: str
         new_pieces = sim.get("pieces", [])
         await game_store.replace_pieces(game_id, new_pieces)
 
-        # Optionally return summary info
-        state = await game_store.get_game_state(game_id)
+        # replace_pieces does not touch the turn, so the snapshot's number is current
         return {
             "status": "success",
             "updated_count": len(new_pieces),
-            "turn_number": state.get("turn_number"),
+            "turn_number": snapshot["turn_number"],
         }
 
     except GameNotFound:
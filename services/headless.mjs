@@ -8,8 +8,13 @@
 // - each "update" performs 8 world.step(...) calls (so effective dt per loop = 1/60)
 // - robust NaN checks before/after stepping
 // Input/Output interface unchanged (read JSON from stdin, write JSON to stdout).
+// With --server the process stays alive and handles one JSON request per stdin
+// line, answering with one JSON line on stdout ({ error } on failure).
 
 import planck from "planck";
+import readline from "node:readline";
+
+const MAX_INPUT_BYTES = 200_000;
 
 // Utility: read all stdin as JSON with size limit
 const readStdin = async (maxBytes = 200_000) => {
@@ -81,8 +86,7 @@ const sanitizeInput = (data) => {
   };
 };
 
-async function main() {
-  const data = await readStdin(200_000);
+function simulate(data) {
   let { pieces, boardBefore, boardAfter } = sanitizeInput(data);
 
   const pl = planck;
@@ -223,10 +227,32 @@ async function main() {
 
   pieces = survivors;
 
-  console.log(JSON.stringify({ pieces }));
+  return { pieces };
+}
+
+async function runOnce() {
+  const data = await readStdin(MAX_INPUT_BYTES);
+  console.log(JSON.stringify(simulate(data)));
+}
+
+async function serve() {
+  const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+  for await (const line of rl) {
+    if (!line.trim()) continue;
+    let out;
+    try {
+      if (Buffer.byteLength(line) > MAX_INPUT_BYTES) throw new Error("stdin too large");
+      out = simulate(JSON.parse(line));
+    } catch (err) {
+      out = { error: String(err) };
+    }
+    process.stdout.write(JSON.stringify(out) + "\n");
+  }
 }
 
-main().catch(err => {
+const entry = process.argv.includes("--server") ? serve : runOnce;
+
+entry().catch(err => {
   console.error(JSON.stringify({ error: String(err) }));
   process.exit(1);
 });
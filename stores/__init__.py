@@ -67,41 +67,54 @@ auth_store: Optional[AuthStore] = None
 _stores_initialized = False
 
 
-def init_stores(db_path: str) -> None:
+_init_lock = asyncio.Lock()
+
+
+async def init_stores_async(db_path: str) -> None:
     """Initialize module-level store singletons for this process.
 
-    This is safe to call multiple times; initialization is idempotent.
-    If called inside an existing asyncio event loop it will schedule the
-    underlying async connection initialization as a background task; when
-    called from synchronous entrypoints (Celery worker process start)
-    it will run the async initializers to completion.
+    Idempotent and safe to call concurrently: the lock makes later callers
+    wait for the first one, and the singletons are only published once their
+    connections are open, so `get_game_store` never sees a half-initialized
+    store.
     """
     global game_store, auth_store, _stores_initialized
 
     if _stores_initialized:
         return
 
-    if game_store is None:
-        game_store = _SqliteGameStore(db_path)
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            # no running loop -> safe to run the coroutine
-            asyncio.run(game_store.init())
-        else:
-            # running loop -> schedule initialization
-            asyncio.create_task(game_store.init())
+    async with _init_lock:
+        if _stores_initialized:
+            return
 
-    if auth_store is None:
-        auth_store = _SqliteAuthStore(db_path)
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            asyncio.run(auth_store.init())
-        else:
-            asyncio.create_task(auth_store.init())
-
-    _stores_initialized = True
+        if game_store is None:
+            gs = _SqliteGameStore(db_path, pool_size=config.DB_POOL_SIZE)
+            await gs.init()
+            game_store = gs
+
+        if auth_store is None:
+            au = _SqliteAuthStore(db_path, readers=config.DB_POOL_SIZE)
+            await au.init()
+            auth_store = au
+
+        _stores_initialized = True
+
+
+def init_stores(db_path: str) -> None:
+    """Synchronous wrapper around `init_stores_async` for entrypoints without
+    an event loop (Celery worker processes).
+
+    Code already running inside an event loop must await
+    `init_stores_async` instead.
+    """
+    if _stores_initialized:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(init_stores_async(db_path))
+    else:
+        raise RuntimeError("init_stores() called inside a running event loop; await init_stores_async() instead")
 
 
 def get_game_store():
@@ -55,6 +55,9 @@ class AuthStore(ABC):
         """
         Retrieve (salt, hashed) for a game.
         Returns None if password not set.
+
+        Never compare the result directly; pass it to `routes.auth._check_password`,
+        which verifies in constant time and hides whether the game exists.
         """
 
     @abstractmethod
@@ -65,6 +68,9 @@ class AuthStore(ABC):
         """
         Retrieve (salt, hashed) for a player.
         Returns None if password not set.
+
+        Never compare the result directly; pass it to `routes.auth._check_password`,
+        which verifies in constant time and hides whether the player exists.
         """
 
     # -------------------------------------------------
@@ -106,6 +112,20 @@ class AuthStore(ABC):
             SessionNotFound: If token is not found or has expired.
         """
 
+    @abstractmethod
+    def validate_session_token_sync(
+        self,
+        session_token: str,
+    ) -> Optional[dict]:
+        """Blocking form of `validate_session_token`, for callers with no event loop.
+        
+        Returns {game_id, player_id} if token is valid.
+        Automatically cleans up expired tokens.
+        
+        Raises:
+            SessionNotFound: If token is not found or has expired.
+        """
+
     @abstractmethod
     async def invalidate_session(
         self,
@@ -125,7 +145,8 @@ class AuthStore(ABC):
     ) -> bool:
         """Extend session expiration.
         
-        Returns True if refreshed.
+        Returns True if refreshed, or False if the session is already fresh
+        enough that the write was skipped (implementation-defined threshold).
         
         Raises:
             SessionNotFound: If session token is not found or has expired.
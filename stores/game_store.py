@@ -117,6 +117,31 @@ class GameStore(ABC):
         """
 
 
+    @abstractmethod
+    async def register_player_and_join(
+        self,
+        game_id: str,
+        player_id: str,
+        *,
+        name: str,
+        color: Optional[str] = None,
+        player_salt: bytes | None = None,
+        player_hashed: bytes | None = None,
+        session_token: str | None = None,
+        expires_at=None,
+    ) -> None:
+        """Create a player, add them to a game and store their session token atomically.
+
+        Either every row is written or none is.
+
+        Raises:
+            PlayerAlreadyExists: If a player with this ID already exists.
+            PasswordAlreadyExists: If password insertion fails (password already set).
+            GameNotFound: If the game does not exist.
+            GameFull: If the game has reached max_players.
+        """
+
+
     @abstractmethod
     async def leave_game(
         self,
@@ -173,6 +198,19 @@ class GameStore(ABC):
         """
 
 
+    @abstractmethod
+    async def get_game_snapshot(self, game_id: str) -> dict:
+        """
+        Return what a simulation run needs in one read:
+        - settings (as `get_game_settings`)
+        - turn_number
+        - pieces (as `get_pieces`)
+
+        Raises:
+            GameNotFound: If the game does not exist.
+        """
+
+
     @abstractmethod
     async def get_current_turn(self, game_id: str) -> int:
         """Return current turn number."""
@@ -284,6 +322,13 @@ class GameStore(ABC):
         Return count of unused game IDs that are not currently leased.
         """
 
+    @abstractmethod
+    async def has_at_least_unused_game_ids(self, target: int) -> bool:
+        """
+        Return whether at least `target` unused game IDs are not currently leased.
+        Stops at the target'th row instead of counting the whole pool.
+        """
+
     @abstractmethod
     async def reserve_unused_game_id(self, lease_seconds: int = 120) -> Optional[str]:
         """
@@ -312,5 +357,27 @@ class GameStore(ABC):
         `inactivity_days` days (by date_created). Returns the number of players deleted.
         """
 
+    @abstractmethod
+    async def delete_stale_games_and_players(self, inactivity_days: int = 30) -> tuple[int, int]:
+        """
+        Run delete_stale_games then delete_stale_players against the same cutoff,
+        so players orphaned by the game delete go too. Returns (games_deleted, players_deleted).
+        """
+
+    @abstractmethod
+    async def claim_due_turns(self, *, limit: int = 100, reclaim_after: int = 300) -> list[tuple[str, int]]:
+        """
+        Claim up to `limit` scheduled turns whose run time has passed and return
+        them as (game_id, turn_number). Claims older than `reclaim_after` seconds
+        (a dispatcher that died mid-way) are handed out again.
+        """
+
+    @abstractmethod
+    async def complete_due_turns(self, turns: list[tuple[str, int]]) -> None:
+        """
+        Remove dispatched turns claimed via `claim_due_turns`. A turn that has
+        since been rescheduled for the same game is left in place.
+        """
+
 
 
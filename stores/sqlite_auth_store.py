@@ -1,5 +1,12 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from zoneinfo import ZoneInfo
+from pathlib import Path
+import time
+import logging
+import sqlite3
+import threading
 import aiosqlite
 
 from .auth_store import AuthStore
@@ -8,84 +15,291 @@ from .exceptions import (
     GameNotFound,
     PlayerNotFound,
     SessionNotFound,
+    UnexpectedResult,
 )
-import sqlite3
+
+logger = logging.getLogger(__name__)
+
+_SESSION_LOOKUP_SQL = "SELECT game_id, player_id, expires_at FROM session_tokens WHERE session_token = ?"
+
+
+def to_epoch(expires_at) -> int:
+    """Coerce a timestamp (unix seconds, aware datetime or ISO string) to unix seconds.
+
+    session_tokens.expires_at and the game tables' timestamps are stored as
+    INTEGERs so time checks are a plain integer compare; ISO strings are
+    accepted for rows written before.
+    """
+    if isinstance(expires_at, (int, float)):
+        return int(expires_at)
+    if isinstance(expires_at, str):
+        expires_at = datetime.fromisoformat(expires_at)
+    return int(expires_at.timestamp())
 
 
 async def insert_game_password(conn: aiosqlite.Connection, game_id: str, salt: bytes, hashed: bytes, *, commit: bool = True):
     """Insert a game password using the provided DB connection.
 
     Raises `GameNotFound` if the game does not exist.
-    Raises `PasswordAlreadyExists` if the row already exists (unique constraint).
-    If `commit` is False, the caller manages transaction/commit.
+    Raises `PasswordAlreadyExists` if a password is already set.
+    If `commit` is False, the caller manages transaction/commit (and rollback).
     """
-    # Verify the game exists first
-    cur = await conn.execute("SELECT 1 FROM games WHERE game_id = ?", (game_id,))
-    if await cur.fetchone() is None:
-        raise GameNotFound(game_id)
-    
-    try:
-        await conn.execute(
+    # The existence check rides along in the INSERT and duplicates are ignored,
+    # so the common path raises nothing; only a no-op insert looks up why.
+    cur = await conn.execute(
+        """
+        INSERT OR IGNORE INTO game_passwords (game_id, salt, hashed)
+        SELECT ?, ?, ?
+        WHERE EXISTS (SELECT 1 FROM games WHERE game_id = ?)
+        """,
+        (game_id, salt, hashed, game_id),
+    )
+    if cur.rowcount == 0:
+        if commit:
+            await conn.rollback()
+        cur = await conn.execute(
             """
-            INSERT INTO game_passwords (game_id, salt, hashed)
-            VALUES (?, ?, ?)
+            SELECT EXISTS (SELECT 1 FROM game_passwords WHERE game_id = ?),
+                   EXISTS (SELECT 1 FROM games WHERE game_id = ?)
             """,
-            (game_id, salt, hashed),
+            (game_id, game_id),
         )
-        if commit:
-            await conn.commit()
-    except sqlite3.IntegrityError as exc:
-        raise PasswordAlreadyExists(f"Game password for {game_id} already exists") from exc
+        password_exists, game_exists = await cur.fetchone()
+        if password_exists:
+            raise PasswordAlreadyExists(f"Game password for {game_id} already exists")
+        if not game_exists:
+            raise GameNotFound(game_id)
+        raise UnexpectedResult(f"Game password for {game_id} was not inserted")
+    if commit:
+        await conn.commit()
 
 
 async def insert_player_password(conn: aiosqlite.Connection, player_id: str, salt: bytes, hashed: bytes, *, commit: bool = True):
     """Insert a player password using the provided DB connection.
 
     Raises `PlayerNotFound` if the player does not exist.
-    Raises `PasswordAlreadyExists` if the row already exists (unique constraint).
-    If `commit` is False, the caller manages transaction/commit.
+    Raises `PasswordAlreadyExists` if a password is already set.
+    If `commit` is False, the caller manages transaction/commit (and rollback).
     """
-    # Verify the player exists first
-    cur = await conn.execute("SELECT 1 FROM players WHERE player_id = ?", (player_id,))
-    if await cur.fetchone() is None:
-        raise PlayerNotFound(f"Player {player_id} not found")
-    
-    try:
-        await conn.execute(
+    # The existence check rides along in the INSERT and duplicates are ignored,
+    # so the common path raises nothing; only a no-op insert looks up why.
+    cur = await conn.execute(
+        """
+        INSERT OR IGNORE INTO player_passwords (player_id, salt, hashed)
+        SELECT ?, ?, ?
+        WHERE EXISTS (SELECT 1 FROM players WHERE player_id = ?)
+        """,
+        (player_id, salt, hashed, player_id),
+    )
+    if cur.rowcount == 0:
+        if commit:
+            await conn.rollback()
+        cur = await conn.execute(
             """
-            INSERT INTO player_passwords (player_id, salt, hashed)
-            VALUES (?, ?, ?)
+            SELECT EXISTS (SELECT 1 FROM player_passwords WHERE player_id = ?),
+                   EXISTS (SELECT 1 FROM players WHERE player_id = ?)
             """,
-            (player_id, salt, hashed),
+            (player_id, player_id),
         )
-        if commit:
-            await conn.commit()
-    except sqlite3.IntegrityError as exc:
-        raise PasswordAlreadyExists(f"Player password for {player_id} already exists") from exc
+        password_exists, player_exists = await cur.fetchone()
+        if password_exists:
+            raise PasswordAlreadyExists(f"Player password for {player_id} already exists")
+        if not player_exists:
+            raise PlayerNotFound(f"Player {player_id} not found")
+        raise UnexpectedResult(f"Player password for {player_id} was not inserted")
+    if commit:
+        await conn.commit()
+
+
+async def insert_session_token(conn: aiosqlite.Connection, session_token: str, *, game_id: str | None, player_id: str | None, expires_at, commit: bool = True):
+    """Insert or replace a session token using the provided DB connection.
+
+    Callers are responsible for checking that `game_id`/`player_id` exist.
+    If `commit` is False, the caller manages transaction/commit.
+    """
+    await conn.execute(
+        """
+        INSERT OR REPLACE INTO session_tokens (session_token, game_id, player_id, expires_at)
+        VALUES (?, ?, ?, ?)
+        """,
+        (session_token, game_id, player_id, to_epoch(expires_at)),
+    )
+    if commit:
+        await conn.commit()
 
 
 class SqliteAuthStore(AuthStore):
     """SQLite-based implementation of AuthStore."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, *, readers: int = 2, session_cache_size: int = 10_000, session_cache_ttl: float = 2.0,
+                 refresh_threshold_seconds: int = 24 * 60 * 60, write_batch_size: int = 64):
         self.db_path = db_path
-        self.db: aiosqlite.Connection = None
+        self.db: aiosqlite.Connection = None  # all writes go through this connection
+        self.reader_count = max(1, readers)
+        # Reads bypass aiosqlite: each pool thread keeps its own read-only
+        # sqlite3 connection (see _read_conn)
+        self._read_uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        self._read_pool: ThreadPoolExecutor | None = None
+        self._read_local = threading.local()
+        self._read_conns: list[sqlite3.Connection] = []
+        self._read_conns_lock = threading.Lock()
+        # token -> (game_id, player_id, expires_at, cached_until). Other API
+        # worker processes and ON DELETE CASCADE can remove a token without this
+        # process noticing, so entries are only trusted for `session_cache_ttl`
+        # seconds before the row is re-read. That is how long a logout on
+        # another worker can take to apply here, so keep it to a couple of
+        # seconds: enough to absorb a page's burst of requests, no more.
+        self._session_cache: OrderedDict[str, tuple[str | None, str | None, int, float]] = OrderedDict()
+        self.session_cache_size = session_cache_size
+        self.session_cache_ttl = session_cache_ttl
+        # refresh_session skips the write unless it extends expiry by at least this much
+        self.refresh_threshold_seconds = refresh_threshold_seconds
+        # Group commit: writes queued while a batch runs share its transaction
+        self.write_batch_size = max(1, write_batch_size)
+        self._write_queue: asyncio.Queue | None = None
+        self._writer_task: asyncio.Task | None = None
+        self._writer_loop = None
 
     async def init(self):
         """Initialize database connection. Call this after construction."""
+        # sqlite3 caches prepared statements by SQL text; 256 covers every
+        # statement this store issues, so none are re-prepared.
         self.db = await aiosqlite.connect(
             self.db_path,
-            timeout=30.0
+            timeout=30.0,
+            cached_statements=256,
         )
-        # Switch to DELETE journal mode instead of WAL to avoid Docker volume locking issues
-        await self.db.execute("PRAGMA journal_mode=DELETE")
+        # WAL (also set by scripts/init_sqlite.py) keeps session reads from blocking on writers
+        await self.db.execute("PRAGMA journal_mode=WAL")
+        await self.db.execute("PRAGMA synchronous=NORMAL")
+        await self.db.execute("PRAGMA temp_store=MEMORY")
+        await self.db.execute("PRAGMA mmap_size=268435456")
+        await self.db.execute("PRAGMA cache_size=-65536")
         self.db.row_factory = aiosqlite.Row
 
+        # Password and session lookups run on this pool. Under WAL they read a
+        # committed snapshot without queueing behind the writer's statements.
+        self._read_pool = ThreadPoolExecutor(max_workers=self.reader_count, thread_name_prefix="auth-read")
+
     async def close(self):
-        """Close database connection."""
+        """Close database connections."""
+        if self._writer_task is not None and not self._writer_task.done():
+            self._writer_task.cancel()
+        if self._read_pool is not None:
+            self._read_pool.shutdown(wait=True)
+            self._read_pool = None
+        with self._read_conns_lock:
+            conns, self._read_conns = self._read_conns, []
+        for conn in conns:
+            conn.close()
+        self._read_local = threading.local()
         if self.db:
             await self.db.close()
 
+    def _read_conn(self) -> sqlite3.Connection:
+        """Return the calling pool thread's read-only connection, opening it on first use."""
+        conn = getattr(self._read_local, "conn", None)
+        if conn is None:
+            # Plain sqlite3 on a worker thread skips aiosqlite's per-statement
+            # queue hop; its statement cache keeps each lookup prepared.
+            conn = sqlite3.connect(self._read_uri, uri=True, timeout=30.0, cached_statements=256,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA query_only=1")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            with self._read_conns_lock:
+                self._read_conns.append(conn)
+            self._read_local.conn = conn
+        return conn
+
+    def _fetchone_sync(self, sql: str, params: tuple):
+        return self._read_conn().execute(sql, params).fetchone()
+
+    async def _fetchone(self, sql: str, params: tuple):
+        """Run a single-row SELECT on the read pool and return the row tuple (or None)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_pool, self._fetchone_sync, sql, params)
+
+    # -------------------------------------------------
+    # Write coalescing
+    # -------------------------------------------------
+
+    async def _write(self, op):
+        """Run `await op(conn)` on the writer connection in the next group commit.
+
+        Writes queued while a batch is running are committed together in one
+        transaction. Each op runs under its own SAVEPOINT, so a failing op only
+        undoes its own changes and its exception is raised to its own caller.
+        Ops must not commit or roll back themselves.
+        """
+        loop = asyncio.get_running_loop()
+        if self._writer_task is None or self._writer_task.done() or self._writer_loop is not loop:
+            # Celery tasks call the store from a fresh asyncio.run() loop each time
+            self._write_queue = asyncio.Queue()
+            self._writer_loop = loop
+            self._writer_task = loop.create_task(self._drain_writes(self._write_queue))
+        fut = loop.create_future()
+        self._write_queue.put_nowait((op, fut))
+        return await fut
+
+    async def _drain_writes(self, queue: asyncio.Queue):
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.write_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            outcomes = []
+            try:
+                await self.db.execute("BEGIN IMMEDIATE")
+                for op, fut in batch:
+                    await self.db.execute("SAVEPOINT write_op")
+                    try:
+                        outcomes.append((fut, await op(self.db), None))
+                    except Exception as exc:
+                        await self.db.execute("ROLLBACK TO write_op")
+                        outcomes.append((fut, None, exc))
+                    await self.db.execute("RELEASE write_op")
+                await self.db.commit()
+            except Exception as exc:
+                # The transaction itself failed: nothing in this batch was written
+                logger.error(f"Auth store write batch failed: {exc}", exc_info=True)
+                if self.db.in_transaction:
+                    await self.db.rollback()
+                outcomes = [(fut, None, exc) for _, fut in batch]
+
+            for fut, result, exc in outcomes:
+                if fut.done():
+                    continue  # caller was cancelled
+                if exc is not None:
+                    fut.set_exception(exc)
+                else:
+                    fut.set_result(result)
+
+    # -------------------------------------------------
+    # Session cache
+    # -------------------------------------------------
+
+    def _cache_session(self, session_token: str, game_id: str | None, player_id: str | None, expires_at: int) -> None:
+        self._session_cache[session_token] = (game_id, player_id, expires_at, time.monotonic() + self.session_cache_ttl)
+        self._session_cache.move_to_end(session_token)
+        # No awaits between insert and eviction, so no lock is needed on the event loop
+        while len(self._session_cache) > self.session_cache_size:
+            self._session_cache.popitem(last=False)
+
+    def _cached_session(self, session_token: str, now: int) -> dict | None:
+        entry = self._session_cache.get(session_token)
+        if entry is None:
+            return None
+        game_id, player_id, expires_at, cached_until = entry
+        if cached_until < time.monotonic() or expires_at < now:
+            del self._session_cache[session_token]
+            return None
+        self._session_cache.move_to_end(session_token)
+        return {
+            "game_id": game_id,
+            "player_id": player_id,
+        }
+
     # -------------------------------------------------
     # Password management
     # -------------------------------------------------
@@ -103,7 +317,7 @@ class SqliteAuthStore(AuthStore):
             GameNotFound: If the game does not exist.
             PasswordAlreadyExists: If a password is already set for this game.
         """
-        await insert_game_password(self.db, game_id, salt, hashed, commit=True)
+        await self._write(lambda conn: insert_game_password(conn, game_id, salt, hashed, commit=False))
 
     async def set_player_password(
         self,
@@ -117,7 +331,7 @@ class SqliteAuthStore(AuthStore):
             PlayerNotFound: If the player does not exist.
             PasswordAlreadyExists: If a password is already set for this player.
         """
-        await insert_player_password(self.db, player_id, salt, hashed, commit=True)
+        await self._write(lambda conn: insert_player_password(conn, player_id, salt, hashed, commit=False))
 
     async def get_game_password(
         self,
@@ -128,13 +342,10 @@ class SqliteAuthStore(AuthStore):
         Returns None if password not set or if any error occurs (read-only operation).
         """
         try:
-            cur = await self.db.execute(
-                """
-                SELECT salt, hashed FROM game_passwords WHERE game_id = ?
-                """,
+            row = await self._fetchone(
+                "SELECT salt, hashed FROM game_passwords WHERE game_id = ?",
                 (game_id,),
             )
-            row = await cur.fetchone()
             if not row:
                 return None
             return (row[0], row[1])
@@ -151,13 +362,10 @@ class SqliteAuthStore(AuthStore):
         Returns None if password not set or if any error occurs (read-only operation).
         """
         try:
-            cur = await self.db.execute(
-                """
-                SELECT salt, hashed FROM player_passwords WHERE player_id = ?
-                """,
+            row = await self._fetchone(
+                "SELECT salt, hashed FROM player_passwords WHERE player_id = ?",
                 (player_id,),
             )
-            row = await cur.fetchone()
             if not row:
                 return None
             return (row[0], row[1])
@@ -192,27 +400,29 @@ class SqliteAuthStore(AuthStore):
         if game_id is None and player_id is None:
             raise ValueError("At least one of game_id or player_id must be provided")
         
-        # Verify game exists if provided
-        if game_id is not None:
-            cur = await self.db.execute("SELECT 1 FROM games WHERE game_id = ?", (game_id,))
-            if await cur.fetchone() is None:
-                raise GameNotFound(game_id)
-        
-        # Verify player exists if provided
-        if player_id is not None:
-            cur = await self.db.execute("SELECT 1 FROM players WHERE player_id = ?", (player_id,))
-            if await cur.fetchone() is None:
+        expires_at = to_epoch(expires_at)
+
+        async def upsert(conn):
+            # One guarded upsert; the IDs are only looked up separately when it
+            # writes nothing, to report which one is missing.
+            cur = await conn.execute(
+                """
+                INSERT OR REPLACE INTO session_tokens (session_token, game_id, player_id, expires_at)
+                SELECT ?, ?, ?, ?
+                WHERE (? IS NULL OR EXISTS (SELECT 1 FROM games WHERE game_id = ?))
+                  AND (? IS NULL OR EXISTS (SELECT 1 FROM players WHERE player_id = ?))
+                """,
+                (session_token, game_id, player_id, expires_at, game_id, game_id, player_id, player_id),
+            )
+            if cur.rowcount == 0:
+                if game_id is not None:
+                    cur = await conn.execute("SELECT 1 FROM games WHERE game_id = ?", (game_id,))
+                    if await cur.fetchone() is None:
+                        raise GameNotFound(game_id)
                 raise PlayerNotFound(f"Player {player_id} not found")
-        
-        # Use INSERT OR REPLACE to update if token already exists
-        await self.db.execute(
-            """
-            INSERT OR REPLACE INTO session_tokens (session_token, game_id, player_id, expires_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (session_token, game_id, player_id, expires_at),
-        )
-        await self.db.commit()
+
+        await self._write(upsert)
+        self._cache_session(session_token, game_id, player_id, expires_at)
 
     async def validate_session_token(
         self,
@@ -221,53 +431,59 @@ class SqliteAuthStore(AuthStore):
         """Validate and return session info if valid.
         
         Returns {game_id, player_id} or None if expired/not found.
-        Automatically cleans up expired tokens.
+        This is a pure read: expired rows are left for `delete_expired_sessions`.
+        Recently seen tokens are answered from memory without a DB read.
         
         """
-        cur = await self.db.execute(
-            """
-            SELECT game_id, player_id, expires_at
-            FROM session_tokens
-            WHERE session_token = ?
-            """,
-            (session_token,),
-        )
-        row = await cur.fetchone()
-        if not row:
-            return None
-
-        game_id, player_id, expires_at = row[0], row[1], row[2]
-
-        # Check expiration
-        now = datetime.now(ZoneInfo("America/Toronto"))
-        if expires_at:
-            if isinstance(expires_at, str):
-                expires_dt = datetime.fromisoformat(expires_at)
-            else:
-                expires_dt = expires_at
-
-            if expires_dt < now:
-                # Clean up expired token
-                await self.db.execute(
-                    "DELETE FROM session_tokens WHERE session_token = ?",
-                    (session_token,),
-                )
-                await self.db.commit()
-                return None
+        now = int(time.time())
+        cached = self._cached_session(session_token, now)
+        if cached is not None:
+            return cached
 
-        # Ensure any implicit read transaction is closed before returning
-        try:
-            await self.db.commit()
-        except Exception:
-            # If commit fails for any reason, ignore and still return token info;
-            # this is defensive — commit is expected to succeed on normal connections.
-            pass
+        row = await self._fetchone(_SESSION_LOOKUP_SQL, (session_token,))
+        session = self._live_session(row, now)
+        if session is None:
+            return None
 
+        game_id, player_id, expires_at = session
+        self._cache_session(session_token, game_id, player_id, expires_at)
         return {
             "game_id": game_id,
             "player_id": player_id,
         }
 
+    def validate_session_token_sync(self, session_token: str) -> dict | None:
+        """Blocking form of `validate_session_token` for code with no event loop.
+
+        Reads on the calling thread's own read-only connection. The session
+        cache is left alone: it belongs to the event loop thread.
+        """
+        row = self._fetchone_sync(_SESSION_LOOKUP_SQL, (session_token,))
+        session = self._live_session(row, int(time.time()))
+        if session is None:
+            return None
+        return {
+            "game_id": session[0],
+            "player_id": session[1],
+        }
+
+    @staticmethod
+    def _live_session(row, now: int) -> tuple | None:
+        """Return (game_id, player_id, expires_at) for a session row, or None if missing/expired."""
+        if not row:
+            return None
+
+        game_id, player_id, expires_at = row[0], row[1], row[2]
+        if not isinstance(expires_at, int):
+            expires_at = to_epoch(expires_at)
+
+        # Check expiration
+        if expires_at < now:
+            # The daily delete_expired_session_tokens task removes the row;
+            # deleting here would put a write on every request's auth path.
+            return None
+        return game_id, player_id, expires_at
+
     async def invalidate_session(
         self,
         session_token: str,
@@ -277,13 +493,17 @@ class SqliteAuthStore(AuthStore):
         Raises:
             SessionNotFound: If the session token is not found.
         """
-        cur = await self.db.execute(
-            "DELETE FROM session_tokens WHERE session_token = ?",
-            (session_token,),
-        )
-        await self.db.commit()
-        if cur.rowcount == 0:
-            raise SessionNotFound(f"Session token {session_token} not found")
+        self._session_cache.pop(session_token, None)
+
+        async def delete(conn):
+            cur = await conn.execute(
+                "DELETE FROM session_tokens WHERE session_token = ?",
+                (session_token,),
+            )
+            return cur.rowcount
+
+        if await self._write(delete) == 0:
+            raise SessionNotFound("session not found")
 
     async def refresh_session(
         self,
@@ -291,44 +511,88 @@ class SqliteAuthStore(AuthStore):
         new_expires_at,
     ) -> bool:
         """Extend session expiration.
+
+        Returns False without writing when the session would be extended by
+        less than `refresh_threshold_seconds`; treat that as "already fresh".
         
         Raises:
             SessionNotFound: If the session token is not found or has expired.
         """
-        # validate_session_token now raises SessionNotFound if not found or expired
-        session_info = await self.validate_session_token(session_token)
+        new_expires_at = to_epoch(new_expires_at)
+        now = int(time.time())
 
-        # Update expiration
-        await self.db.execute(
-            """
-            UPDATE session_tokens
-            SET expires_at = ?
-            WHERE session_token = ?
-            """,
-            (new_expires_at, session_token),
-        )
-        await self.db.commit()
+        async def update(conn):
+            # One guarded UPDATE: expired, unknown and still-fresh tokens match no row
+            cur = await conn.execute(
+                """
+                UPDATE session_tokens
+                SET expires_at = ?
+                WHERE session_token = ? AND expires_at >= ? AND expires_at <= ?
+                """,
+                (new_expires_at, session_token, now, new_expires_at - self.refresh_threshold_seconds),
+            )
+            if cur.rowcount == 0:
+                # Only on the no-write path: tell "fresh enough" apart from missing
+                cur = await conn.execute(
+                    "SELECT 1 FROM session_tokens WHERE session_token = ? AND expires_at >= ?",
+                    (session_token, now),
+                )
+                if await cur.fetchone() is None:
+                    raise SessionNotFound("session not found or expired")
+                return False
+            return True
+
+        try:
+            refreshed = await self._write(update)
+        except SessionNotFound:
+            self._session_cache.pop(session_token, None)
+            raise
+        if not refreshed:
+            return False
+
+        cached = self._session_cache.get(session_token)
+        if cached is not None:
+            self._cache_session(session_token, cached[0], cached[1], new_expires_at)
         return True
 
-    async def delete_expired_sessions(self) -> int:
-        # Raises: None
-        """Cleanup task. Deletes expired sessions, returns count."""
+    async def delete_expired_sessions(self, batch_size: int = 1000) -> int:
         """Cleanup task. Deletes expired sessions, returns count.
+
+        Rows are deleted `batch_size` at a time (picked via idx_sessions_expiry),
+        one write batch each, so the write lock is never held for long even
+        with a large expired backlog.
         
         Raises:
             None - this is a maintenance operation that should not fail the system.
         """
-        try:
-            now = datetime.now(ZoneInfo("America/Toronto"))
-            cur = await self.db.execute(
+        deleted = 0
+        now = int(time.time())
+
+        async def delete_batch(conn):
+            cur = await conn.execute(
                 """
                 DELETE FROM session_tokens
-                WHERE expires_at < ?
+                WHERE session_token IN (
+                    SELECT session_token FROM session_tokens
+                    WHERE expires_at < ?
+                    LIMIT ?
+                )
                 """,
-                (now,),
+                (now, batch_size),
             )
-            await self.db.commit()
             return cur.rowcount
+
+        try:
+            while True:
+                # each batch is its own queued write, so session writes interleave
+                count = await self._write(delete_batch)
+                deleted += count
+                if count < batch_size:
+                    break
+            for token, entry in list(self._session_cache.items()):
+                if entry[2] < now:
+                    del self._session_cache[token]
+            return deleted
         except Exception:
             # Silently fail cleanup operations to avoid disrupting the system
-            return 0
\ No newline at end of file
+            return deleted
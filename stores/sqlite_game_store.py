@@ -1,9 +1,13 @@
 import json
+import asyncio
+import functools
+from contextvars import ContextVar
 from datetime import datetime
 from zoneinfo import ZoneInfo
 import aiosqlite
 from typing import Iterable
 import logging
+import time
 
 # NOTE: services.game_simulation imports deferred to avoid loading subprocess/Node.js
 # dependencies at worker startup time. Imported locally in methods that use it.
@@ -15,58 +19,144 @@ from .exceptions import (
     PasswordAlreadyExists,
     TurnMismatch,
     InvalidState,
+    GameFull,
     UnexpectedResult
 )
 from .game_store import GameStore
-from .sqlite_auth_store import insert_game_password, insert_player_password
+from .sqlite_auth_store import insert_game_password, insert_player_password, insert_session_token, to_epoch
 import sqlite3
 
 logger = logging.getLogger(__name__)
 
+TORONTO_TZ = ZoneInfo("America/Toronto")
+
+# How many times advance_turn_if_ready re-simulates when a submission lands
+# while the simulation runs, before giving up and letting the task retry.
+_ADVANCE_TURN_ATTEMPTS = 3
+
+
+def _from_epoch(value) -> str | None:
+    """Render a stored unix-seconds column as the ISO string the API returns."""
+    if value is None or isinstance(value, str):
+        return value
+    return datetime.fromtimestamp(value, TORONTO_TZ).isoformat()
+
+# Connection checked out by the store method running in the current task.
+_current_conn: ContextVar[aiosqlite.Connection | None] = ContextVar("sqlite_game_store_conn", default=None)
+
+
+def _pooled(method):
+    """Run a store method on a connection checked out from the pool.
+
+    Nested store calls in the same task reuse the connection already checked
+    out. A transaction left open by a failed method is rolled back before the
+    connection is returned, so it cannot leak into the next caller.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if _current_conn.get() is not None:
+            return await method(self, *args, **kwargs)
+        conn = await self._pool.get()
+        token = _current_conn.set(conn)
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            _current_conn.reset(token)
+            try:
+                if conn.in_transaction:
+                    await conn.rollback()
+            finally:
+                self._pool.put_nowait(conn)
+    return wrapper
+
+
 class SqliteGameStore(GameStore):
 
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, *, pool_size: int = 4):
         self.db_path = db_path
-        self.db: aiosqlite.Connection = None
+        self.pool_size = max(1, pool_size)
+        self._pool: asyncio.Queue = None
+        self._conns: list[aiosqlite.Connection] = []
         logger.info(f"[STORE] SqliteGameStore initialized with db_path: {db_path}")
 
-    async def init(self):
-        """Initialize database connection. Call this after construction."""
+    @property
+    def db(self) -> aiosqlite.Connection:
+        """The connection checked out for the store method currently running."""
+        conn = _current_conn.get()
+        if conn is None:
+            raise RuntimeError("SqliteGameStore connection used outside a store method")
+        return conn
+
+    async def _connect(self) -> aiosqlite.Connection:
         # Use check_same_thread=False to allow multiple workers to access the same DB
-        # Use timeout for reasonable concurrent access handling with WAL mode
+        # Use timeout for reasonable concurrent access handling
         # 30s timeout allows queries to wait for write locks to release
-        self.db = await aiosqlite.connect(
+        # sqlite3 keeps prepared statements in an LRU keyed by SQL text, so
+        # repeated calls skip parsing and planning; 256 leaves headroom over the
+        # ~80 distinct statements this store issues.
+        conn = await aiosqlite.connect(
             self.db_path,
             check_same_thread=False,
             timeout=30.0,
+            cached_statements=256,
             isolation_level=None  # Disable implicit transactions, manage explicitly
         )
-        # Switch to DELETE journal mode instead of WAL to avoid Docker volume locking issues
-        # WAL mode has known problems with Docker volume mounts in multi-process scenarios
-        await self.db.execute("PRAGMA journal_mode=DELETE")
-        await self.db.execute("PRAGMA foreign_keys=ON")
-        
-        self.db.row_factory = aiosqlite.Row
-        logger.info(f"[STORE] Database connection established to {self.db_path}")
+        # WAL lets readers proceed while a writer holds the lock; it is safe on the
+        # local bind mount used by docker-compose (all containers share the host kernel).
+        # synchronous=NORMAL is durable under WAL and avoids an fsync per commit.
+        # Pragmas are per connection, so they are applied once here, not per call.
+        async with conn.execute("PRAGMA journal_mode=WAL") as cur:
+            mode = (await cur.fetchone())[0]
+        if mode.lower() != "wal":
+            # SQLite silently keeps the old mode when WAL is unavailable (e.g. a
+            # filesystem without shared-memory support); readers then block on writers.
+            logger.warning(f"[STORE] journal_mode is {mode!r}, not WAL, for {self.db_path}")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        await conn.execute("PRAGMA foreign_keys=ON")
+        await conn.execute("PRAGMA temp_store=MEMORY")
+        await conn.execute("PRAGMA cache_size=-65536")
+        # Read pages straight from a shared mapping instead of a pread() per page
+        # miss; the mapping is shared by every pooled connection in the process.
+        await conn.execute("PRAGMA mmap_size=268435456")
+        conn.row_factory = aiosqlite.Row
+        return conn
+
+    async def init(self):
+        """Open the connection pool. Call this after construction.
+
+        Each concurrent store call gets its own connection, so one request's
+        BEGIN IMMEDIATE ... COMMIT cannot interleave with another's statements.
+        """
+        self._pool = asyncio.Queue()
+        for _ in range(self.pool_size):
+            conn = await self._connect()
+            self._conns.append(conn)
+            self._pool.put_nowait(conn)
+        logger.info(f"[STORE] Opened {self.pool_size} database connections to {self.db_path}")
         
-        # Verify tables exist
-        async with self.db.execute("SELECT name FROM sqlite_master WHERE type='table'") as cursor:
-            tables = await cursor.fetchall()
-            if not tables:
+        # Verify tables exist; listing them is only worth the read when debugging
+        conn = self._conns[0]
+        async with conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' LIMIT 1") as cursor:
+            if await cursor.fetchone() is None:
                 logger.error(f"[STORE] ✗ No tables found! Database may be empty or corrupted")
                 raise RuntimeError(f"Database at {self.db_path} has no tables - initialization may have failed")
-            logger.info(f"[STORE] Database has {len(tables)} tables: {[t[0] for t in tables]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            async with conn.execute("SELECT name FROM sqlite_master WHERE type='table'") as cursor:
+                tables = await cursor.fetchall()
+            logger.debug(f"[STORE] Database has {len(tables)} tables: {[t[0] for t in tables]}")
 
     async def close(self):
-        """Close database connection."""
-        if self.db:
-            await self.db.close()
+        """Close all pooled database connections."""
+        conns, self._conns = self._conns, []
+        for conn in conns:
+            await conn.close()
 
     # -------------------------------------------------
     # Lifecycle
     # -------------------------------------------------
 
+    @_pooled
     async def create_game(
         self,
         game_id: str,
@@ -85,38 +175,34 @@ class SqliteGameStore(GameStore):
         logger.info(f"[STORE] Creating game: {game_id}")
         
         await self.db.execute("BEGIN IMMEDIATE")
-        # Defer FK checks so we can insert child rows before parent; checked at commit
-        await self.db.execute("PRAGMA defer_foreign_keys = ON")
-        # Check if game already exists while holding the lock
-        cur_check = await self.db.execute(
-            "SELECT 1 FROM games WHERE game_id = ?",
-            (game_id,),
-        )
-        exists = await cur_check.fetchone()
-        if exists:
-            await self.db.rollback()
-            raise GameAlreadyExists(f"Game {game_id} already exists")
+        # game_settings/game_state FKs are DEFERRABLE INITIALLY DEFERRED in the
+        # schema, so the child rows can go in before the parent; checked at commit
         # Insert a row into the `games` table so DB triggers that
         # reference `unused_game_ids` (defined in schema.sql) are fired.
-        now = datetime.now(ZoneInfo("America/Toronto"))
+        now = datetime.now(TORONTO_TZ)
         start_time = datetime.fromtimestamp(
             now.timestamp() + start_delay,
-            tz=ZoneInfo("America/Toronto"),
+            tz=TORONTO_TZ,
         )
         
         try:
             # Insert child tables first (game_settings, game_state) before the parent
             # so that AFTER INSERT triggers on `games` find them already present.
 
-            # Create game settings
-            await self.db.execute(
+            # Create game settings. Every game has exactly one settings row, so a
+            # conflict here doubles as the "game already exists" check.
+            cur = await self.db.execute(
                 """
                 INSERT INTO game_settings (
                     game_id, max_players, board_size, board_shrink, turn_interval
                 ) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(game_id) DO NOTHING
                 """,
                 (game_id, max_players, board_size, board_shrink, turn_interval),
             )
+            if cur.rowcount == 0:
+                await self.db.rollback()
+                raise GameAlreadyExists(f"Game {game_id} already exists")
 
             # Initialize game state
             await self.db.execute(
@@ -124,13 +210,13 @@ class SqliteGameStore(GameStore):
                 INSERT INTO game_state (game_id, turn_number, last_turn_time, next_turn_time)
                 VALUES (?, 0, ?, ?)
                 """,
-                (game_id, now, start_time),
+                (game_id, to_epoch(now), to_epoch(start_time)),
             )
 
             # Insert core game row (triggers check for settings/state which now exist)
             await self.db.execute(
                 "INSERT INTO games (game_id, creator_player_id, start_time, created_at) VALUES (?, ?, ?, ?)",
-                (game_id, None, start_time, now),
+                (game_id, None, to_epoch(start_time), to_epoch(now)),
             )
 
             # If caller supplied a password, insert it using the auth helper
@@ -147,6 +233,7 @@ class SqliteGameStore(GameStore):
             # Unexpected integrity error, likely due to concurrent insert
             raise UnexpectedResult("Unexpected integrity error during game creation") from exc
 
+    @_pooled
     async def delete_game(
         self,
         game_id: str,
@@ -160,38 +247,19 @@ class SqliteGameStore(GameStore):
             GameNotFound: If the game does not exist.
         """
         await self.db.execute("BEGIN IMMEDIATE")
-
-        # Verify game exists before deleting
+        # ON DELETE CASCADE removes settings, state, players, pieces, old pieces,
+        # passwords and sessions; the settings/state delete guards only fire
+        # while the game row still exists, and it is gone by then.
         cur = await self.db.execute(
-            "SELECT 1 FROM games WHERE game_id = ?",
+            "DELETE FROM games WHERE game_id = ?",
             (game_id,),
         )
-        if await cur.fetchone() is None:
+        if cur.rowcount == 0:
             await self.db.rollback()
             raise GameNotFound(game_id)
-
-        # Delete all related data
-        await self.db.execute("DELETE FROM pieces WHERE game_id = ?", (game_id,))
-        await self.db.execute(
-            "DELETE FROM pieces_old WHERE game_id = ?", (game_id,)
-        )
-        await self.db.execute(
-            "DELETE FROM game_players WHERE game_id = ?", (game_id,)
-        )
-        await self.db.execute(
-            "DELETE FROM game_settings WHERE game_id = ?", (game_id,)
-        )
-        await self.db.execute(
-            "DELETE FROM game_state WHERE game_id = ?", (game_id,)
-        )
-        # Remove the game row itself so DB state is consistent.
-        await self.db.execute(
-            "DELETE FROM games WHERE game_id = ?",
-            (game_id,),
-        )
-
         await self.db.commit()
 
+    @_pooled
     async def start_game(
         self,
         game_id: str,
@@ -238,25 +306,25 @@ class SqliteGameStore(GameStore):
         turn_interval = settings_row[0] if settings_row else 86400
 
         # Set player colors
-        for player_id, color in colors.items():
-            await self.db.execute(
-                """
-                UPDATE game_players SET color = ? WHERE game_id = ? AND player_id = ?
-                """,
-                (color, game_id, player_id),
-            )
+        await self.db.executemany(
+            """
+            UPDATE game_players SET color = ? WHERE game_id = ? AND player_id = ?
+            """,
+            [(color, game_id, player_id) for player_id, color in colors.items()],
+        )
 
-        # Insert pieces
+        # Insert pieces (one executemany: a single prepared statement and one
+        # hop to the connection thread instead of one per piece)
         await self.db.execute(
             "DELETE FROM pieces WHERE game_id = ?",
             (game_id,),
         )
-        for p in pieces:
-            await self.db.execute(
-                """
-                INSERT INTO pieces (piece_id, game_id, owner_player_id, x, y, vx, vy, radius, mass)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        await self.db.executemany(
+            """
+            INSERT INTO pieces (piece_id, game_id, owner_player_id, x, y, vx, vy, radius, mass)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     p.get("pieceid"),
                     game_id,
@@ -267,14 +335,14 @@ class SqliteGameStore(GameStore):
                     p.get("vy"),
                     p.get("radius", 30),
                     p.get("mass", 1),
-                ),
-            )
+                )
+                for p in pieces
+            ],
+        )
 
         # Calculate next_turn_time as last_turn_time + turn_interval seconds
-        next_turn_time = datetime.fromtimestamp(
-            last_turn_time.timestamp() + turn_interval,
-            tz=last_turn_time.tzinfo,
-        )
+        last_turn_time = to_epoch(last_turn_time)
+        next_turn_time = last_turn_time + int(turn_interval)
 
         # Update game state
         await self.db.execute(
@@ -283,17 +351,13 @@ class SqliteGameStore(GameStore):
             """,
             (last_turn_time, next_turn_time, game_id),
         )
+        # Schedule turn 1 in the same transaction; dispatch_due_turns enqueues
+        # run_turn once it is due, so no broker call happens on this path.
+        await self._schedule_turn(game_id, 1, next_turn_time)
 
         await self.db.commit()
-        
-        # Schedule run_turn task at next_turn_time
-        try:
-            from workers.tasks import run_turn as celery_run_turn
-            celery_run_turn.apply_async(args=[game_id, 1], eta=next_turn_time)
-        except Exception as exc:
-            import logging
-            logging.getLogger(__name__).error(f"Failed to schedule run_turn task for {game_id}: {exc}")
     
+    @_pooled
     async def get_game(self, game_id: str) -> dict:
         # Raises: GameNotFound, InvalidState
         """
@@ -304,120 +368,77 @@ class SqliteGameStore(GameStore):
             GameNotFound: If the game does not exist.
             InvalidState: If game data is inconsistent across tables.
         """
-        # Verify game exists first
-        cur = await self.db.execute(
-            "SELECT 1 FROM games WHERE game_id = ?",
-            (game_id,),
-        )
-        if await cur.fetchone() is None:
-            raise GameNotFound(game_id)
-        
-        # Get game settings
+        # One round trip: each table's rows are tagged with `kind` and stacked
+        # with UNION ALL (joining players and both piece tables would return
+        # their cross product), then partitioned below.
         cur = await self.db.execute(
             """
-            SELECT max_players, board_size, board_shrink, turn_interval
-            FROM game_settings
-            WHERE game_id = ?
+            SELECT 0, g.creator_player_id, s.max_players, s.board_size, s.board_shrink,
+                   s.turn_interval, st.turn_number, st.last_turn_time, st.next_turn_time
+            FROM games g
+            LEFT JOIN game_settings s ON s.game_id = g.game_id
+            LEFT JOIN game_state st ON st.game_id = g.game_id
+            WHERE g.game_id = ?
+            UNION ALL
+            SELECT 1, player_id, name, color, submitted_turn, NULL, NULL, NULL, NULL
+            FROM game_players WHERE game_id = ?
+            UNION ALL
+            SELECT 2, piece_id, owner_player_id, x, y, vx, vy, radius, mass
+            FROM pieces WHERE game_id = ?
+            UNION ALL
+            SELECT 3, piece_id, owner_player_id, x, y, vx, vy, radius, mass
+            FROM pieces_old WHERE game_id = ?
             """,
-            (game_id,),
+            (game_id, game_id, game_id, game_id),
         )
-        settings_row = await cur.fetchone()
-        if not settings_row:
+
+        header = None
+        players = {}
+        pieces = []
+        pieces_old = []
+        for r in await cur.fetchall():
+            kind = r[0]
+            if kind == 0:
+                header = r
+            elif kind == 1:
+                players[r[1]] = {
+                    "name": r[2],
+                    "color": r[3],
+                    "submitted_turn": bool(r[4]),
+                }
+            else:
+                (pieces if kind == 2 else pieces_old).append({
+                    "piece_id": r[1],
+                    "owner_player_id": r[2],
+                    "x": r[3],
+                    "y": r[4],
+                    "vx": r[5],
+                    "vy": r[6],
+                    "radius": r[7],
+                    "mass": r[8],
+                })
+
+        if header is None:
+            raise GameNotFound(game_id)
+        # max_players / turn_number are NOT NULL, so NULL means the row is missing
+        if header[2] is None:
             raise InvalidState(f"Game {game_id} exists but has no settings")
+        if header[6] is None:
+            raise InvalidState(f"Game {game_id} exists but has no state")
+
+        creator = header[1]
         settings = {
-            "max_players": settings_row[0],
-            "board_size": settings_row[1],
-            "board_shrink": settings_row[2],
-            "turn_interval": settings_row[3],
+            "max_players": header[2],
+            "board_size": header[3],
+            "board_shrink": header[4],
+            "turn_interval": header[5],
         }
-
-        # Get game state
-        cur = await self.db.execute(
-            """
-            SELECT turn_number, last_turn_time, next_turn_time
-            FROM game_state
-            WHERE game_id = ?
-            """,
-            (game_id,),
-        )
-        state_row = await cur.fetchone()
-        if not state_row:
-            raise InvalidState(f"Game {game_id} exists but has no state")
         state = {
-            "turn_number": state_row[0],
-            "last_turn_time": state_row[1],
-            "next_turn_time": state_row[2],
+            "turn_number": header[6],
+            "last_turn_time": _from_epoch(header[7]),
+            "next_turn_time": _from_epoch(header[8]),
         }
 
-        # Get players
-        cur = await self.db.execute(
-            """
-            SELECT player_id, name, color, submitted_turn
-            FROM game_players
-            WHERE game_id = ?
-            """,
-            (game_id,),
-        )
-        players = {}
-        for r in await cur.fetchall():
-            players[r[0]] = {
-                "name": r[1],
-                "color": r[2],
-                "submitted_turn": bool(r[3]),
-            }
-
-        # Get pieces
-        cur = await self.db.execute(
-            """
-            SELECT piece_id, owner_player_id, x, y, vx, vy, radius, mass
-            FROM pieces
-            WHERE game_id = ?
-            """,
-            (game_id,),
-        )
-        pieces = [
-            {
-                "piece_id": r[0],
-                "owner_player_id": r[1],
-                "x": r[2],
-                "y": r[3],
-                "vx": r[4],
-                "vy": r[5],
-                "radius": r[6],
-                "mass": r[7],
-            }
-            for r in await cur.fetchall()
-        ]
-
-        # Get old pieces
-        cur = await self.db.execute(
-            """
-            SELECT piece_id, owner_player_id, x, y, vx, vy, radius, mass
-            FROM pieces_old
-            WHERE game_id = ?
-            """,
-            (game_id,),
-        )
-        pieces_old = [
-            {
-                "piece_id": r[0],
-                "owner_player_id": r[1],
-                "x": r[2],
-                "y": r[3],
-                "vx": r[4],
-                "vy": r[5],
-                "radius": r[6],
-                "mass": r[7],
-            }
-            for r in await cur.fetchall()
-        ]
-
-        # Get creator
-        cur = await self.db.execute(
-            "SELECT creator_player_id FROM games WHERE game_id = ?", (game_id,))
-        creator_row = await cur.fetchone()
-        creator = creator_row[0] if creator_row else None
-
         return {
             "game_id": game_id,
             "settings": settings,
@@ -430,99 +451,117 @@ class SqliteGameStore(GameStore):
     """SQLite-based implementation of GameStore with atomic operations."""
 
 
+    @_pooled
     async def add_unused_game_ids(self, names: Iterable[str]) -> int:
         # Raises: None
         """
         Add multiple suggested game ids to the unused pool.
 
         Returns number of names actually inserted (skips ids that already
-        exist as real games).
+        exist as real games or are already in the pool).
         """
         # Normalize and deduplicate
         candidates = {n.strip() for n in names if n and n.strip()}
         if not candidates:
             return 0
 
+        now = int(time.time())
         await self.db.execute("BEGIN IMMEDIATE")
-        # Exclude any names that already exist as game_id
-        placeholders = ",".join("?" for _ in candidates)
-        cur = await self.db.execute(
-            f"SELECT game_id FROM games WHERE game_id IN ({placeholders})",
-            tuple(candidates),
-        )
-        rows = await cur.fetchall()
-        existing = {r[0] for r in rows}
-        to_insert = candidates - existing
-        if not to_insert:
-            await self.db.commit()
-            return 0
-
-        now = datetime.now(ZoneInfo("America/Toronto"))
-        for nm in to_insert:
-            await self.db.execute(
-                "INSERT OR IGNORE INTO unused_game_ids (name, last_refreshed) VALUES (?, ?)",
-                (nm, now),
+        try:
+            # One executemany in one transaction; names that already exist as a
+            # game_id or in the pool are skipped by the statement itself.
+            cur = await self.db.executemany(
+                """
+                INSERT OR IGNORE INTO unused_game_ids (name, last_refreshed)
+                SELECT ?, ?
+                WHERE NOT EXISTS (SELECT 1 FROM games WHERE game_id = ?)
+                """,
+                [(nm, now, nm) for nm in candidates],
             )
-
+            inserted = cur.rowcount
+        except Exception:
+            await self.db.rollback()
+            raise
         await self.db.commit()
-        return len(to_insert)
+        return inserted
 
+    @_pooled
     async def list_unused_game_ids(self, limit: int = 10) -> list[str]:
         # Raises: None
         """
         Return up to `limit` unused game ids that are not currently leased.
         """
         cur = await self.db.execute(
-            "SELECT name FROM unused_game_ids WHERE leased_until IS NULL OR leased_until < datetime('now') ORDER BY last_refreshed DESC LIMIT ?",
-            (limit,),
+            "SELECT name FROM unused_game_ids WHERE leased_until IS NULL OR leased_until < ? ORDER BY last_refreshed DESC LIMIT ?",
+            (int(time.time()), limit),
         )
         rows = await cur.fetchall()
         return [r[0] for r in rows]
 
+    @_pooled
     async def count_unused_game_ids(self) -> int:
         # Raises: None
         """
         Return count of unused game IDs that are not currently leased.
         """
         cur = await self.db.execute(
-            "SELECT COUNT(*) FROM unused_game_ids WHERE leased_until IS NULL OR leased_until < datetime('now')"
+            "SELECT COUNT(*) FROM unused_game_ids WHERE leased_until IS NULL OR leased_until < ?",
+            (int(time.time()),),
         )
         row = await cur.fetchone()
         return row[0] if row else 0
 
+    @_pooled
+    async def has_at_least_unused_game_ids(self, target: int) -> bool:
+        # Raises: None
+        """
+        Return whether at least `target` unused game IDs are not currently leased.
+        """
+        if target <= 0:
+            return True
+        cur = await self.db.execute(
+            """
+            SELECT EXISTS(
+                SELECT 1 FROM unused_game_ids
+                WHERE leased_until IS NULL OR leased_until < ?
+                LIMIT 1 OFFSET ?
+            )
+            """,
+            (int(time.time()), target - 1),
+        )
+        row = await cur.fetchone()
+        return bool(row[0]) if row else False
+
+    @_pooled
     async def reserve_unused_game_id(self, lease_seconds: int = 120) -> str | None:
         # Raises: None
         """
         Atomically pick one available unused id, set `leased_until` for
         `lease_seconds`, and return the name. Returns `None` if none available.
 
-        Retries briefly if a race is detected.
+        A single UPDATE ... RETURNING picks and leases the name, so there is
+        no window for another caller to take it in between.
         """
-        for _ in range(3):
-            await self.db.execute("BEGIN IMMEDIATE")
-            cur = await self.db.execute(
-                "SELECT name FROM unused_game_ids WHERE leased_until IS NULL OR leased_until < datetime('now') ORDER BY last_refreshed DESC LIMIT 1"
-            )
-            row = await cur.fetchone()
-            if not row:
-                await self.db.rollback()
-                return None
-
-            name = row[0]
-            # Attempt to claim this name only if it's still unleased.
-            cursor = await self.db.execute(
-                "UPDATE unused_game_ids SET leased_until = datetime('now', ?) WHERE name = ? AND (leased_until IS NULL OR leased_until < datetime('now'))",
-                (f'+{lease_seconds} seconds', name),
+        # Autocommit: the statement is its own transaction. fetchall() runs it
+        # to completion so the write is committed before we return.
+        now = int(time.time())
+        cur = await self.db.execute(
+            """
+            UPDATE unused_game_ids SET leased_until = ?
+            WHERE name = (
+                SELECT name FROM unused_game_ids
+                WHERE leased_until IS NULL OR leased_until < ?
+                ORDER BY last_refreshed DESC
+                LIMIT 1
             )
+            RETURNING name
+            """,
+            (now + lease_seconds, now),
+        )
+        rows = await cur.fetchall()
+        return rows[0][0] if rows else None
 
-            if cursor.rowcount == 1:
-                await self.db.commit()
-                return name
-
-            await self.db.rollback()
-
-        return None
-
+    @_pooled
     async def clear_stale_leases(self) -> int:
         # Raises: None
         """
@@ -531,54 +570,150 @@ class SqliteGameStore(GameStore):
         """
         await self.db.execute("BEGIN IMMEDIATE")
         cursor = await self.db.execute(
-            "UPDATE unused_game_ids SET leased_until = NULL WHERE leased_until IS NOT NULL AND leased_until < datetime('now')"
+            "UPDATE unused_game_ids SET leased_until = NULL WHERE leased_until IS NOT NULL AND leased_until < ?",
+            (int(time.time()),),
         )
         cleared_count = cursor.rowcount
         await self.db.commit()
         return cleared_count
 
-    async def delete_stale_games(self, inactivity_days: int = 30) -> int:
+    @_pooled
+    async def delete_stale_games(self, inactivity_days: int = 30, batch_size: int = 1000) -> int:
         # Raises: None
         """
         Delete all games not accessed for more than `inactivity_days` days.
         A game is considered stale if created_at is older than the threshold.
         Returns the number of games deleted (cascade will delete related records).
         """
-        await self.db.execute("BEGIN IMMEDIATE")
-        cursor = await self.db.execute(
-            """
-            DELETE FROM games 
-            WHERE created_at < datetime('now', ? || ' days')
-            """,
-            (f"-{inactivity_days}",),
-        )
-        deleted_count = cursor.rowcount
-        await self.db.commit()
-        return deleted_count
+        cutoff = int(time.time()) - inactivity_days * 86400
+        return await self._delete_in_batches(self._delete_stale_games, cutoff, batch_size)
 
-    async def delete_stale_players(self, inactivity_days: int = 30) -> int:
+    @_pooled
+    async def delete_stale_players(self, inactivity_days: int = 30, batch_size: int = 1000) -> int:
         # Raises: None
         """
         Delete all players not associated with any active games and older than
         `inactivity_days` days (by date_created). Returns the number of players deleted.
         """
-        await self.db.execute("BEGIN IMMEDIATE")
+        cutoff = int(time.time()) - inactivity_days * 86400
+        return await self._delete_in_batches(self._delete_stale_players, cutoff, batch_size)
+
+    @_pooled
+    async def delete_stale_games_and_players(self, inactivity_days: int = 30, batch_size: int = 1000) -> tuple[int, int]:
+        # Raises: None
+        """
+        Delete stale games, then stale players, against the same cutoff.
+        Players left without a game by the first delete are picked up by the second.
+        Returns (games_deleted, players_deleted).
+        """
+        cutoff = int(time.time()) - inactivity_days * 86400
+        games_deleted = await self._delete_in_batches(self._delete_stale_games, cutoff, batch_size)
+        players_deleted = await self._delete_in_batches(self._delete_stale_players, cutoff, batch_size)
+        return games_deleted, players_deleted
+
+    async def _delete_in_batches(self, delete_batch, cutoff: int, batch_size: int) -> int:
+        """
+        Call `delete_batch(cutoff, batch_size)` in its own write transaction until
+        it deletes fewer than `batch_size` rows, so a large backlog (e.g. after an
+        outage) never holds the write lock or grows the WAL for long.
+        """
+        deleted = 0
+        while True:
+            await self.db.execute("BEGIN IMMEDIATE")
+            count = await delete_batch(cutoff, batch_size)
+            await self.db.commit()
+            deleted += count
+            if count < batch_size:
+                return deleted
+
+    async def _delete_stale_games(self, cutoff: int, limit: int) -> int:
+        """Delete up to `limit` games created before `cutoff`. Caller holds the write transaction."""
         cursor = await self.db.execute(
             """
-            DELETE FROM players 
-            WHERE date_created < datetime('now', ? || ' days')
-              AND player_id NOT IN (SELECT player_id FROM game_players)
+            DELETE FROM games
+            WHERE game_id IN (
+                SELECT game_id FROM games
+                WHERE created_at < ?
+                LIMIT ?
+            )
             """,
-            (f"-{inactivity_days}",),
+            (cutoff, limit),
         )
-        deleted_count = cursor.rowcount
-        await self.db.commit()
-        return deleted_count
+        return cursor.rowcount
+
+    async def _delete_stale_players(self, cutoff: int, limit: int) -> int:
+        """Delete up to `limit` gameless players created before `cutoff`. Caller holds the write transaction."""
+        cursor = await self.db.execute(
+            """
+            DELETE FROM players
+            WHERE player_id IN (
+                SELECT player_id FROM players
+                WHERE date_created < ?
+                  AND NOT EXISTS (SELECT 1 FROM game_players gp WHERE gp.player_id = players.player_id)
+                LIMIT ?
+            )
+            """,
+            (cutoff, limit),
+        )
+        return cursor.rowcount
 
     # -------------------------------------------------
     # Players
     # -------------------------------------------------
 
+    async def _insert_player(self, player_id: str, player_salt: bytes | None, player_hashed: bytes | None) -> None:
+        """Insert a player (and optional password). Caller holds the write transaction."""
+        try:
+            cur = await self.db.execute(
+                """
+                INSERT INTO players (player_id, date_created) VALUES (?, ?)
+                ON CONFLICT(player_id) DO NOTHING
+                """,
+                (player_id, int(time.time())),
+            )
+        except sqlite3.IntegrityError as exc:
+            raise UnexpectedResult("Unexpected integrity error during player creation") from exc
+        if cur.rowcount == 0:
+            raise PlayerAlreadyExists(f"Player {player_id} already exists")
+
+        # If caller provided password bytes, insert password as part of same tx
+        if player_salt is not None and player_hashed is not None:
+            # Let PasswordAlreadyExists propagate - it's a distinct error
+            await insert_player_password(self.db, player_id, player_salt, player_hashed, commit=False)
+
+    async def _insert_game_player(self, game_id: str, player_id: str, name: str, color: str | None) -> None:
+        """Add a player to a game, enforcing max_players. Caller holds the write transaction."""
+        # The capacity and player checks ride along in the INSERT; a missing
+        # settings row makes the comparison NULL, so an unknown game inserts nothing.
+        cur = await self.db.execute(
+            """
+            INSERT INTO game_players (game_id, player_id, name, color)
+            SELECT ?, ?, ?, ?
+            WHERE (SELECT COUNT(*) FROM game_players WHERE game_id = ?)
+                  < (SELECT max_players FROM game_settings WHERE game_id = ?)
+              AND EXISTS (SELECT 1 FROM players WHERE player_id = ?)
+            """,
+            (game_id, player_id, name, color, game_id, game_id, player_id),
+        )
+        if cur.rowcount:
+            return
+
+        # Nothing inserted: work out which check failed
+        cur = await self.db.execute(
+            """
+            SELECT EXISTS (SELECT 1 FROM game_settings WHERE game_id = ?),
+                   EXISTS (SELECT 1 FROM players WHERE player_id = ?)
+            """,
+            (game_id, player_id),
+        )
+        game_exists, player_exists = await cur.fetchone()
+        if not game_exists:
+            raise GameNotFound(game_id)
+        if not player_exists:
+            raise PlayerNotFound(f"Player {player_id} not found")
+        raise GameFull(f"Game {game_id} is full")
+
+    @_pooled
     async def create_player(self, player_id: str, *, player_salt: bytes | None = None, player_hashed: bytes | None = None) -> None:
         """Create a global player record.
 
@@ -589,36 +724,15 @@ class SqliteGameStore(GameStore):
             PlayerAlreadyExists: If a player with the given ID already exists.
             PasswordAlreadyExists: If password insertion fails (password already set).
         """
-        now = datetime.now(ZoneInfo("America/Toronto"))
-
         await self.db.execute("BEGIN IMMEDIATE")
-        # Check if player already exists while holding the lock
-        cur = await self.db.execute(
-            "SELECT 1 FROM players WHERE player_id = ?",
-            (player_id,),
-        )
-        exists = await cur.fetchone()
-        if exists:
-            await self.db.rollback()
-            raise PlayerAlreadyExists(f"Player {player_id} already exists")
-
         try:
-            await self.db.execute(
-                "INSERT INTO players (player_id, date_created) VALUES (?, ?)",
-                (player_id, now),
-            )
-
-            # If caller provided password bytes, insert password as part of same tx
-            if player_salt is not None and player_hashed is not None:
-                # Let PasswordAlreadyExists propagate - it's a distinct error
-                await insert_player_password(self.db, player_id, player_salt, player_hashed, commit=False)
-
-            await self.db.commit()
-        except sqlite3.IntegrityError as exc:
+            await self._insert_player(player_id, player_salt, player_hashed)
+        except Exception:
             await self.db.rollback()
-            # Unexpected integrity error, likely due to concurrent insert
-            raise UnexpectedResult("Unexpected integrity error during player creation") from exc
+            raise
+        await self.db.commit()
 
+    @_pooled
     async def add_player_to_game(
         self,
         game_id: str,
@@ -638,54 +752,53 @@ class SqliteGameStore(GameStore):
             GameFull: If the game has reached max_players.
         """
         await self.db.execute("BEGIN IMMEDIATE")
-        # Check if game exists
-        cur = await self.db.execute(
-            """
-            SELECT max_players FROM game_settings WHERE game_id = ?
-            """,
-            (game_id,),
-        )
-        settings = await cur.fetchone()
-        if not settings:
-            await self.db.rollback()
-            raise GameNotFound(game_id)
-
-        # Check if player exists
-        cur = await self.db.execute(
-            "SELECT 1 FROM players WHERE player_id = ?",
-            (player_id,),
-        )
-        if await cur.fetchone() is None:
+        try:
+            await self._insert_game_player(game_id, player_id, name, color)
+        except Exception:
             await self.db.rollback()
-            raise PlayerNotFound(f"Player {player_id} not found")
-
-        max_players = settings[0]
+            raise
+        await self.db.commit()
 
-        cur = await self.db.execute(
-            """
-            SELECT COUNT(*) as count FROM game_players WHERE game_id = ?
-            """,
-            (game_id,),
-        )
-        count_row = await cur.fetchone()
-        current_count = count_row[0]
+    @_pooled
+    async def register_player_and_join(
+        self,
+        game_id: str,
+        player_id: str,
+        *,
+        name: str,
+        color: str | None = None,
+        player_salt: bytes | None = None,
+        player_hashed: bytes | None = None,
+        session_token: str | None = None,
+        expires_at=None,
+    ) -> None:
+        # Raises: PlayerAlreadyExists, PasswordAlreadyExists, GameNotFound, GameFull
+        """
+        Create a player, add them to a game and store their session token
+        in a single transaction (one commit instead of three).
 
-        if current_count >= max_players:
+        Raises:
+            PlayerAlreadyExists: If a player with the given ID already exists.
+            PasswordAlreadyExists: If password insertion fails (password already set).
+            GameNotFound: If the game does not exist.
+            GameFull: If the game has reached max_players.
+        """
+        await self.db.execute("BEGIN IMMEDIATE")
+        try:
+            await self._insert_player(player_id, player_salt, player_hashed)
+            await self._insert_game_player(game_id, player_id, name, color)
+            if session_token is not None:
+                await insert_session_token(
+                    self.db, session_token,
+                    game_id=game_id, player_id=player_id, expires_at=expires_at,
+                    commit=False,
+                )
+        except Exception:
             await self.db.rollback()
-            from .game_store import GameFull
-            raise GameFull(f"Game {game_id} is full")
-
-        # Add to game
-        await self.db.execute(
-            """
-            INSERT INTO game_players (game_id, player_id, name, color)
-            VALUES (?, ?, ?, ?)
-            """,
-            (game_id, player_id, name, color),
-        )
-
+            raise
         await self.db.commit()
 
+    @_pooled
     async def leave_game(
         self,
         game_id: str,
@@ -721,6 +834,7 @@ class SqliteGameStore(GameStore):
 
         await self.db.commit()
 
+    @_pooled
     async def list_players(self, game_id: str) -> list[dict]:
         # Raises: None
         """Return players in a game (read-only)."""
@@ -747,6 +861,7 @@ class SqliteGameStore(GameStore):
     # Read-side queries (NO state changes)
     # -------------------------------------------------
 
+    @_pooled
     async def get_game_summary(self, game_id: str) -> dict:
         # Raises: GameNotFound
         """
@@ -768,12 +883,13 @@ class SqliteGameStore(GameStore):
         return {
             "game_id": game_id,
             "turn_number": row[0],
-            "last_turn_time": row[1],
-            "next_turn_time": row[2],
+            "last_turn_time": _from_epoch(row[1]),
+            "next_turn_time": _from_epoch(row[2]),
             "max_players": row[3],
             "board_size": row[4],
         }
 
+    @_pooled
     async def get_game_settings(self, game_id: str) -> dict:
         # Raises: GameNotFound
         """Return static game configuration."""
@@ -796,6 +912,7 @@ class SqliteGameStore(GameStore):
             "turn_interval": row[3],
         }
 
+    @_pooled
     async def get_game_state(self, game_id: str) -> dict:
         # Raises: GameNotFound
         """
@@ -818,10 +935,56 @@ class SqliteGameStore(GameStore):
 
         return {
             "turn_number": row[0],
-            "last_turn_time": row[1],
-            "next_turn_time": row[2],
+            "last_turn_time": _from_epoch(row[1]),
+            "next_turn_time": _from_epoch(row[2]),
+        }
+
+    @_pooled
+    async def get_game_snapshot(self, game_id: str) -> dict:
+        # Raises: GameNotFound
+        """Return settings, turn number and pieces for a game in one query."""
+        cur = await self.db.execute(
+            """
+            SELECT s.max_players, s.board_size, s.board_shrink, s.turn_interval,
+                   st.turn_number,
+                   p.piece_id, p.owner_player_id, p.x, p.y, p.vx, p.vy, p.radius, p.mass
+            FROM game_settings s
+            JOIN game_state st ON st.game_id = s.game_id
+            LEFT JOIN pieces p ON p.game_id = s.game_id
+            WHERE s.game_id = ?
+            """,
+            (game_id,),
+        )
+        rows = await cur.fetchall()
+        if not rows:
+            raise GameNotFound(game_id)
+
+        first = rows[0]
+        return {
+            "settings": {
+                "max_players": first[0],
+                "board_size": first[1],
+                "board_shrink": first[2],
+                "turn_interval": first[3],
+            },
+            "turn_number": first[4],
+            "pieces": [
+                {
+                    "piece_id": r[5],
+                    "owner_player_id": r[6],
+                    "x": r[7],
+                    "y": r[8],
+                    "vx": r[9],
+                    "vy": r[10],
+                    "radius": r[11],
+                    "mass": r[12],
+                }
+                for r in rows
+                if r[5] is not None
+            ],
         }
 
+    @_pooled
     async def get_current_turn(self, game_id: str) -> int:
         # Raises: GameNotFound
         """Return current turn number."""
@@ -836,6 +999,7 @@ class SqliteGameStore(GameStore):
             raise GameNotFound(game_id)
         return row[0]
     
+    @_pooled
     async def get_game_creator(self, game_id: str) -> str | None:
         # Raises: GameNotFound
         """Return the player_id of the game's creator, or None if not set."""
@@ -848,24 +1012,24 @@ class SqliteGameStore(GameStore):
             raise GameNotFound(game_id)
         return row[0]
 
+    @_pooled
     async def all_players_submitted(self, game_id: str) -> bool:
         # Raises: None
         """
         True if all players have submitted for the current turn.
         """
+        # Stops at the first player who hasn't submitted instead of counting all
         cur = await self.db.execute(
             """
-             SELECT COUNT(*) as total,
-                 SUM(CASE WHEN submitted_turn = 1 THEN 1 ELSE 0 END) as submitted
-            FROM game_players
-            WHERE game_id = ?
+            SELECT EXISTS (SELECT 1 FROM game_players WHERE game_id = ?)
+               AND NOT EXISTS (
+                   SELECT 1 FROM game_players WHERE game_id = ? AND submitted_turn IS NOT 1
+               )
             """,
-            (game_id,),
+            (game_id, game_id),
         )
         row = await cur.fetchone()
-        if not row or row[0] == 0:
-            return False
-        return row[0] == row[1]
+        return bool(row[0])
 
 
 
@@ -873,6 +1037,7 @@ class SqliteGameStore(GameStore):
     # Turn submission (atomic path)
     # -------------------------------------------------
 
+    @_pooled
     async def submit_turn(
         self,
         game_id: str,
@@ -925,20 +1090,20 @@ class SqliteGameStore(GameStore):
 
             # 2. Apply actions by updating piece velocities directly.
             # Also mark the player as having submitted so submission counting works.
-            for action in actions:
-                piece_id = action.get("pieceid")
-                if piece_id is None:
-                    continue
-                vx = action.get("vx")
-                vy = action.get("vy")
-                await self.db.execute(
-                    """
-                    UPDATE pieces
-                    SET vx = ?, vy = ?
-                    WHERE game_id = ? AND piece_id = ? AND owner_player_id = ?
-                    """,
-                    (vx, vy, game_id, str(piece_id), player_id),
-                )
+            # One executemany: the statement is prepared once and every row is
+            # applied on the connection thread while the write lock is held.
+            await self.db.executemany(
+                """
+                UPDATE pieces
+                SET vx = ?, vy = ?
+                WHERE game_id = ? AND piece_id = ? AND owner_player_id = ?
+                """,
+                [
+                    (action.get("vx"), action.get("vy"), game_id, str(action["pieceid"]), player_id)
+                    for action in actions
+                    if action.get("pieceid") is not None
+                ],
+            )
 
             # 3. Set submitted marker so submission counting works
             await self.db.execute(
@@ -960,113 +1125,125 @@ class SqliteGameStore(GameStore):
     # Turn advancement (atomic path)
     # -------------------------------------------------
 
-    async def advance_turn_if_ready(
-        self,
-        game_id: str,
-        turn_number: int,
-    ) -> bool:
-        # Raises: GameNotFound, TurnMismatch, InvalidState, SimulationError
-        """
-        Atomically advance the turn:
-        - collect player submissions (if any)
-        - snapshot pieces (if applicable)
-        - clear submissions
-        - increment turn
-        - update timestamps
+    async def _read_turn_inputs(self, game_id: str, turn_number: int) -> tuple[dict, list[dict]]:
+        """Load the settings and pieces a turn is simulated from.
 
-        Returns True if turn was advanced, False otherwise (on exception).
+        Raises GameNotFound, TurnMismatch if `turn_number` is not the current
+        turn, or InvalidState if the game has no players or settings.
         """
-        # Defer import to avoid loading subprocess/Node.js at worker startup
-        from services.game_simulation import run_js_simulation, DEFAULT_RADIUS, DEFAULT_MASS
-        
-        await self.db.execute("BEGIN IMMEDIATE")
-
-        try:
-            # 1. Verify game exists + get turn
-            cur = await self.db.execute(
-                """
-                SELECT turn_number
-                FROM game_state
-                WHERE game_id = ?
-                """,
-                (game_id,),
-            )
-            row = await cur.fetchone()
-            if not row:
-                raise GameNotFound(game_id)
+        # 1. Verify game exists + get turn
+        cur = await self.db.execute(
+            """
+            SELECT turn_number
+            FROM game_state
+            WHERE game_id = ?
+            """,
+            (game_id,),
+        )
+        row = await cur.fetchone()
+        if not row:
+            raise GameNotFound(game_id)
 
-            turn_number_db = row[0]
+        turn_number_db = row[0]
 
-            if(turn_number_db != turn_number):
-                raise TurnMismatch(
-                    f"Expected turn {turn_number_db}, got {turn_number}"
-                )
+        if(turn_number_db != turn_number):
+            raise TurnMismatch(
+                f"Expected turn {turn_number_db}, got {turn_number}"
+            )
 
-            # 2. Collect player submission markers (if any).
-            # `submit_turn` writes submitted velocities into the `pieces`
-            # table and sets `submitted_turn = 1` for the player. We use
-            # the integer marker only to know which players have submitted;
-            # we do not re-apply actions here.
-            cur = await self.db.execute(
+        # 2-4. Players, settings and current pieces.
+        # The three reads are independent, so they are queued together:
+        # aiosqlite runs them back-to-back on this connection's thread
+        # instead of waking the event loop between each one.
+        #
+        # `submit_turn` writes submitted velocities into the `pieces`
+        # table, so the pieces read here already carry every submission;
+        # the players are only read to check the game is not empty.
+        rows, settings_rows, piece_rows = await asyncio.gather(
+            self.db.execute_fetchall(
                 """
-                SELECT player_id, submitted_turn
+                SELECT 1
                 FROM game_players
                 WHERE game_id = ?
+                LIMIT 1
                 """,
                 (game_id,),
-            )
-            rows = await cur.fetchall()
-
-            if not rows:
-                raise InvalidState("No players in game")
-
-            submitted_player_ids = [r[0] for r in rows if r[1]]
-
-            # 3. Load game settings
-            cur = await self.db.execute(
+            ),
+            self.db.execute_fetchall(
                 """
                 SELECT max_players, board_size, board_shrink, turn_interval
                 FROM game_settings
                 WHERE game_id = ?
                 """,
                 (game_id,),
-            )
-            settings_row = await cur.fetchone()
-            if not settings_row:
-                raise InvalidState("Missing game settings")
-
-            game_settings = {
-                "max_players": settings_row[0],
-                "board_size": settings_row[1],
-                "board_shrink": settings_row[2],
-                "turn_interval": settings_row[3],
-            }
-
-            # 4. Load current pieces
-            cur = await self.db.execute(
+            ),
+            self.db.execute_fetchall(
                 """
                 SELECT piece_id, owner_player_id, x, y, vx, vy, radius, mass
                 FROM pieces
                 WHERE game_id = ?
+                ORDER BY piece_id
                 """,
                 (game_id,),
-            )
-            pieces = [
-                {
-                    "pieceid": r[0], #yes no underscore, that's what game_simulation.py expects
-                    "owner": r[1],
-                    "x": r[2],
-                    "y": r[3],
-                    "vx": r[4],
-                    "vy": r[5],
-                    "radius": r[6],
-                    "mass": r[7],
-                }
-                for r in await cur.fetchall()
-            ]
-            
-            
-            # 5. Run physics simulation
+            ),
+        )
+
+        if not rows:
+            raise InvalidState("No players in game")
+
+        if not settings_rows:
+            raise InvalidState("Missing game settings")
+        settings_row = settings_rows[0]
+
+        game_settings = {
+            "max_players": settings_row[0],
+            "board_size": settings_row[1],
+            "board_shrink": settings_row[2],
+            "turn_interval": settings_row[3],
+        }
+
+        pieces = [
+            {
+                "pieceid": r[0], #yes no underscore, that's what game_simulation.py expects
+                "owner": r[1],
+                "x": r[2],
+                "y": r[3],
+                "vx": r[4],
+                "vy": r[5],
+                "radius": r[6],
+                "mass": r[7],
+            }
+            for r in piece_rows
+        ]
+        return game_settings, pieces
+
+    @_pooled
+    async def advance_turn_if_ready(
+        self,
+        game_id: str,
+        turn_number: int,
+    ) -> bool:
+        # Raises: GameNotFound, TurnMismatch, InvalidState, SimulationError
+        """
+        Atomically advance the turn:
+        - collect player submissions (if any)
+        - snapshot pieces (if applicable)
+        - clear submissions
+        - increment turn
+        - update timestamps
+
+        The simulation runs between a read snapshot and the write transaction,
+        so the write lock is only held while the results are stored. If a
+        submission lands while it runs, the write transaction is abandoned and
+        the read/simulate/validate cycle repeats, still outside the lock, up to
+        _ADVANCE_TURN_ATTEMPTS times.
+
+        Returns True if turn was advanced, False otherwise (on exception).
+        """
+        # Defer import to avoid loading subprocess/Node.js at worker startup
+        from services.game_simulation import run_js_simulation, DEFAULT_RADIUS, DEFAULT_MASS
+
+        def simulate(game_settings: dict, pieces: list[dict]) -> list[dict]:
             board_before = int(game_settings.get("board_size", 800))
             board_after = board_before - int(game_settings.get("board_shrink", 50))
             sim_result = run_js_simulation(
@@ -1074,14 +1251,52 @@ class SqliteGameStore(GameStore):
                 board_before=board_before,
                 board_after=board_after,
             )
-            new_pieces = sim_result.get("pieces", [])
-            
-            print(f"advance_turn_if_ready: sim_result={sim_result}")
+            logger.debug("advance_turn_if_ready: sim_result=%s", sim_result)
+            return sim_result.get("pieces", [])
+
+        try:
+            for attempt in range(1, _ADVANCE_TURN_ATTEMPTS + 1):
+                # Read phase: a deferred transaction gives the reads one consistent
+                # snapshot without taking the write lock (WAL readers never block
+                # writers), and the simulation runs after it has ended.
+                await self.db.execute("BEGIN")
+                game_settings, pieces = await self._read_turn_inputs(game_id, turn_number)
+                await self.db.commit()
+
+                # 5. Run physics simulation on a worker thread: it blocks for
+                # up to the sidecar timeout and must not stall the event loop
+                # (the sidecar serializes its own requests).
+                new_pieces = await asyncio.to_thread(simulate, game_settings, pieces)
+
+                # Write phase. Re-validate against what is committed now: another
+                # run_turn may have advanced the turn (TurnMismatch), or a player
+                # may have submitted while the simulation ran. In that case drop
+                # the lock and simulate again from the new inputs, rather than
+                # running Node while every other writer waits.
+                await self.db.execute("BEGIN IMMEDIATE")
+                current_settings, current_pieces = await self._read_turn_inputs(game_id, turn_number)
+                if current_pieces == pieces and current_settings == game_settings:
+                    break
+                await self.db.rollback()
+                logger.info(
+                    "advance_turn_if_ready: inputs for %s changed during simulation (attempt %s/%s)",
+                    game_id, attempt, _ADVANCE_TURN_ATTEMPTS,
+                )
+            else:
+                raise UnexpectedResult(
+                    f"Turn {turn_number} inputs for {game_id} kept changing during simulation"
+                )
 
             # 6. Snapshot old pieces (optional but safe)
+            # Overwrite the previous snapshot row by row instead of emptying it
+            # first; only pieces eliminated since then have rows to delete.
             await self.db.execute(
-                "DELETE FROM pieces_old WHERE game_id = ?",
-                (game_id,),
+                """
+                DELETE FROM pieces_old
+                WHERE game_id = ?
+                  AND piece_id NOT IN (SELECT piece_id FROM pieces WHERE game_id = ?)
+                """,
+                (game_id, game_id),
             )
             await self.db.execute(
                 """
@@ -1089,42 +1304,62 @@ class SqliteGameStore(GameStore):
                 SELECT piece_id, game_id, owner_player_id, x, y, vx, vy, radius, mass
                 FROM pieces
                 WHERE game_id = ?
+                ON CONFLICT(game_id, piece_id) DO UPDATE SET
+                    owner_player_id = excluded.owner_player_id,
+                    x = excluded.x,
+                    y = excluded.y,
+                    vx = excluded.vx,
+                    vy = excluded.vy,
+                    radius = excluded.radius,
+                    mass = excluded.mass
                 """,
                 (game_id,),
             )
 
-            # 7. Replace pieces
-            await self.db.execute(
-                "DELETE FROM pieces WHERE game_id = ?",
-                (game_id,),
-            )
-
-            # Preserve owner_player_id from the previous `pieces` by piece_id.
-            # Build a map: old_piece_id (string) -> owner_player_id.
-            owner_map = {p["pieceid"]: p.get("owner") for p in pieces}
-
-            for p in new_pieces:
-                await self.db.execute(
-                    """
-                    INSERT INTO pieces (
-                        piece_id, game_id, owner_player_id,
-                        x, y, vx, vy, radius, mass
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            # 7. Replace pieces in place: most pieces survive a turn, so
+            # update those rows by piece_id and delete only the ones the
+            # simulation removed, rather than emptying and refilling the table.
+            # owner_player_id is left out of the UPDATE so the original owner
+            # is preserved; the sim's owner is only used for an unseen id.
+            await self.db.executemany(
+                """
+                INSERT INTO pieces (
+                    piece_id, game_id, owner_player_id,
+                    x, y, vx, vy, radius, mass
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(piece_id, game_id) DO UPDATE SET
+                    x = excluded.x,
+                    y = excluded.y,
+                    vx = excluded.vx,
+                    vy = excluded.vy,
+                    radius = excluded.radius,
+                    mass = excluded.mass
+                """,
+                [
                     (
-                        p["pieceid"],
+                        # headless.mjs may hand pieceid back as a number
+                        str(p["pieceid"]),
                         game_id,
-                        # lookup by piece_id to preserve original owner; fall back
-                        # to any owner provided in `new_pieces` if mapping missing.
-                        owner_map.get(p.get("pieceid"), p.get("owner")),
+                        p.get("owner"),
                         p["x"],
                         p["y"],
                         p["vx"],
                         p["vy"],
                         p.get("radius", DEFAULT_RADIUS),
                         p.get("mass", DEFAULT_MASS),
-                    ),
-                )
+                    )
+                    for p in new_pieces
+                ],
+            )
+            surviving_ids = {str(p["pieceid"]) for p in new_pieces}
+            await self.db.executemany(
+                "DELETE FROM pieces WHERE game_id = ? AND piece_id = ?",
+                [
+                    (game_id, p["pieceid"])
+                    for p in pieces
+                    if p["pieceid"] not in surviving_ids
+                ],
+            )
 
             # 8. Clear submissions
             await self.db.execute(
@@ -1136,12 +1371,10 @@ class SqliteGameStore(GameStore):
                 (game_id,),
             )
 
-            # 9. Advance turn and set next_turn_time
-            new_last_turn_time = datetime.now(ZoneInfo("America/Toronto"))
-            next_turn_time = datetime.fromtimestamp(
-                new_last_turn_time.timestamp() + game_settings.get("turn_interval", 86400),
-                tz=ZoneInfo("America/Toronto"),
-            )
+            # 9. Advance turn and set next_turn_time (stored as unix seconds,
+            # so plain integer arithmetic; no datetime round-trip)
+            new_last_turn_time = int(time.time())
+            next_turn_time = new_last_turn_time + int(game_settings.get("turn_interval", 86400))
             await self.db.execute(
                 """
                 UPDATE game_state
@@ -1152,18 +1385,11 @@ class SqliteGameStore(GameStore):
                 """,
                 (new_last_turn_time, next_turn_time, game_id),
             )
+            # Replaces this game's pending turn, so an early advance (everyone
+            # submitted) leaves no stale run_turn behind for the old turn.
+            await self._schedule_turn(game_id, turn_number + 1, next_turn_time)
 
             await self.db.commit()
-            
-            # Schedule run_turn task at next_turn_time for the newly incremented turn
-            new_turn_number = turn_number + 1
-            try:
-                from workers.tasks import run_turn as celery_run_turn
-                celery_run_turn.apply_async(args=[game_id, new_turn_number], eta=next_turn_time)
-            except Exception as exc:
-                import logging
-                logging.getLogger(__name__).error(f"Failed to schedule run_turn task for {game_id} turn {new_turn_number}: {exc}")
-            
             return True
 
         except (GameNotFound, TurnMismatch, InvalidState):
@@ -1176,10 +1402,70 @@ class SqliteGameStore(GameStore):
             logger.error(f"Unexpected error in advance_turn_if_ready for {game_id}: {e}")
             raise UnexpectedResult(f"Unexpected error advancing turn for {game_id}") from e
 
+    # -------------------------------------------------
+    # Turn scheduling (outbox read by workers.tasks.dispatch_due_turns)
+    # -------------------------------------------------
+
+    async def _schedule_turn(self, game_id: str, turn_number: int, run_at) -> None:
+        """Record the game's next turn. Caller holds the write transaction."""
+        await self.db.execute(
+            """
+            INSERT OR REPLACE INTO due_turns (game_id, turn_number, run_at, claimed_at)
+            VALUES (?, ?, ?, NULL)
+            """,
+            (game_id, turn_number, to_epoch(run_at)),
+        )
+
+    @_pooled
+    async def claim_due_turns(self, *, limit: int = 100, reclaim_after: int = 300) -> list[tuple[str, int]]:
+        # Raises: None
+        """
+        Claim up to `limit` scheduled turns whose run time has passed and return
+        them as (game_id, turn_number). Claims older than `reclaim_after` seconds
+        (a dispatcher that died mid-way) are handed out again.
+        """
+        now = int(time.time())
+        # Autocommit: one statement, so two dispatchers never claim the same row
+        cur = await self.db.execute(
+            """
+            UPDATE due_turns SET claimed_at = ?
+            WHERE game_id IN (
+                SELECT game_id FROM due_turns
+                WHERE run_at <= ? AND (claimed_at IS NULL OR claimed_at < ?)
+                ORDER BY run_at
+                LIMIT ?
+            )
+            RETURNING game_id, turn_number
+            """,
+            (now, now, now - reclaim_after, limit),
+        )
+        return [(r[0], r[1]) for r in await cur.fetchall()]
+
+    @_pooled
+    async def complete_due_turns(self, turns: list[tuple[str, int]]) -> None:
+        # Raises: None
+        """
+        Remove dispatched turns claimed via `claim_due_turns`. A turn that has
+        since been rescheduled for the same game is left in place.
+        """
+        if not turns:
+            return
+        await self.db.execute("BEGIN IMMEDIATE")
+        try:
+            await self.db.executemany(
+                "DELETE FROM due_turns WHERE game_id = ? AND turn_number = ?",
+                turns,
+            )
+        except Exception:
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+
     # -------------------------------------------------
     # Pieces / simulation data
     # -------------------------------------------------
 
+    @_pooled
     async def get_pieces(self, game_id: str) -> list[dict]:
         # Raises: None
         """Return active pieces."""
@@ -1206,6 +1492,7 @@ class SqliteGameStore(GameStore):
             for r in rows
         ]
 
+    @_pooled
     async def replace_pieces(
         self,
         game_id: str,
@@ -1225,14 +1512,14 @@ class SqliteGameStore(GameStore):
             (game_id,),
         )
 
-        for p in pieces:
-            await self.db.execute(
-                """
-                INSERT INTO pieces (
-                    piece_id, game_id, owner_player_id,
-                    x, y, vx, vy, radius, mass
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        await self.db.executemany(
+            """
+            INSERT INTO pieces (
+                piece_id, game_id, owner_player_id,
+                x, y, vx, vy, radius, mass
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     p["piece_id"],
                     game_id,
@@ -1243,8 +1530,10 @@ class SqliteGameStore(GameStore):
                     p["vy"],
                     p.get("radius", DEFAULT_RADIUS),
                     p.get("mass", DEFAULT_MASS),
-                ),
-            )
+                )
+                for p in pieces
+            ],
+        )
 
         await self.db.commit()
 
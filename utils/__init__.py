@@ -5,12 +5,12 @@ Make commonly used helpers available at the package level for convenience.
 Exports:
 - cookie helpers: `set_cookie`, `get_cookie`, `delete_cookie`, `append_cookie`
 - time helpers: `now_utc`, `now_tz`, `to_iso`, `parse_iso`
-- validation helpers: `is_valid_name`, `sanitize_json`, `VALID_NAME_RE`
+- validation helpers: `is_valid_name`, `sanitize_json`, `NAME_PUNCTUATION`
 """
 
 from .cookies import set_cookie, get_cookie, delete_cookie, append_cookie
 from .time import now_utc, now_tz, to_iso, parse_iso
-from .validation import is_valid_name, sanitize_json, VALID_NAME_RE
+from .validation import is_valid_name, sanitize_json, NAME_PUNCTUATION
 
 __all__ = [
 	"set_cookie",
@@ -23,5 +23,5 @@ __all__ = [
 	"parse_iso",
 	"is_valid_name",
 	"sanitize_json",
-	"VALID_NAME_RE",
+	"NAME_PUNCTUATION",
 ]
@@ -3,6 +3,7 @@
 Small convenience wrappers around FastAPI `Request` and `Response` cookie
 APIs used by route handlers and tests.
 """
+import asyncio
 from typing import Optional, Any, Dict
 from fastapi import Request, Response
 from stores import SessionNotFound, SessionExpired
@@ -50,10 +51,10 @@ def validate_token(session_token: str, auth_store: Any) -> Optional[Dict[str, An
 	Returns:
 		A dict with 'game_id' and 'player_id' keys if valid, None otherwise.
 	"""
-	import asyncio
 	try:
-		# Call the async validate_session_token synchronously
-		result = asyncio.run(auth_store.validate_session_token(session_token))
+		# Blocking lookup on the store's read connection for this thread;
+		# no event loop is created per call.
+		result = auth_store.validate_session_token_sync(session_token)
 		if result:
 			return {
 				"game_id": result.get("game_id"),
@@ -100,26 +101,47 @@ async def check_credentials(
 	if auth_store is None:
 		return results
 
+	# Look up every session cookie that is present at once; the checks
+	# below then run in order, so the first failure raised is the same
+	# as when each lookup was awaited in turn.
+	game_cookie = get_cookie(request, f"game:{game_id}") if game_id else None
+	if game_id and not game_cookie:
+		# Game ID requested but no cookie found
+		raise UnauthorizedException(f"No credentials found for game {game_id}")
+	player_cookie = get_cookie(request, f"player:{player_id}") if player_id else None
+	last_game_cookie = get_cookie(request, "last_game")
+	last_player_cookie = get_cookie(request, "last_player")
+
+	cookies = [game_cookie, player_cookie, last_game_cookie, last_player_cookie]
+	lookups = await asyncio.gather(
+		*(auth_store.validate_session_token(c) for c in cookies if c),
+		return_exceptions=True,
+	)
+	lookups = iter(lookups)
+	game_data, player_data, last_game_data, last_player_data = (
+		next(lookups) if c else None for c in cookies
+	)
+
+	def token_data(data):
+		# A failed lookup is raised when its check is reached, as before
+		if isinstance(data, BaseException):
+			raise data
+		return data
+
 	# Check game credential
 	if game_id:
-		game_cookie = get_cookie(request, f"game:{game_id}")
-		if game_cookie:
-			token_data = await auth_store.validate_session_token(game_cookie)
-			if token_data and token_data.get("game_id") == game_id:
-				results["game_id"] = game_id
-			else:
-				# Cookie exists but failed validation
-				raise UnauthorizedException(f"Invalid credentials for game {game_id}")
+		game_data = token_data(game_data)
+		if game_data and game_data.get("game_id") == game_id:
+			results["game_id"] = game_id
 		else:
-			# Game ID requested but no cookie found
-			raise UnauthorizedException(f"No credentials found for game {game_id}")
+			# Cookie exists but failed validation
+			raise UnauthorizedException(f"Invalid credentials for game {game_id}")
 
 	# Check player credential
 	if player_id:
-		player_cookie = get_cookie(request, f"player:{player_id}")
 		if player_cookie:
-			token_data = await auth_store.validate_session_token(player_cookie)
-			if token_data and token_data.get("player_id") == player_id:
+			player_data = token_data(player_data)
+			if player_data and player_data.get("player_id") == player_id:
 				results["player_id"] = player_id
 			else:
 				# Cookie exists but failed validation
@@ -129,17 +151,13 @@ async def check_credentials(
 			raise UnauthorizedException(f"No credentials found for player {player_id}")
 
 	# Check last_game and last_player (for session recovery)
-	last_game_cookie = get_cookie(request, "last_game")
-	if last_game_cookie:
-		token_data = await auth_store.validate_session_token(last_game_cookie)
-		if token_data and token_data.get("game_id"):
-			results["last_game"] = token_data["game_id"]
+	last_game_data = token_data(last_game_data)
+	if last_game_data and last_game_data.get("game_id"):
+		results["last_game"] = last_game_data["game_id"]
 
-	last_player_cookie = get_cookie(request, "last_player")
-	if last_player_cookie:
-		token_data = await auth_store.validate_session_token(last_player_cookie)
-		if token_data and token_data.get("player_id"):
-			results["last_player"] = token_data["player_id"]
+	last_player_data = token_data(last_player_data)
+	if last_player_data and last_player_data.get("player_id"):
+		results["last_player"] = last_player_data["player_id"]
 
 	return results
 
@@ -2,8 +2,9 @@
 
 These helpers keep code that deals with timestamps consistent across modules.
 """
-from datetime import datetime, timezone
+from datetime import datetime, timezone, tzinfo
 from typing import Optional
+import functools
 import zoneinfo
 
 
@@ -12,13 +13,18 @@ def now_utc() -> datetime:
 	return datetime.now(timezone.utc)
 
 
-def now_tz(tz_name: str) -> datetime:
-	"""Return current datetime in the given timezone name (e.g. 'America/Toronto')."""
+@functools.lru_cache(maxsize=32)
+def _zone(tz_name: str) -> tzinfo:
+	"""Resolve a timezone name once; unknown names fall back to UTC."""
 	try:
-		tz = zoneinfo.ZoneInfo(tz_name)
+		return zoneinfo.ZoneInfo(tz_name)
 	except Exception:
-		tz = timezone.utc
-	return datetime.now(tz)
+		return timezone.utc
+
+
+def now_tz(tz_name: str) -> datetime:
+	"""Return current datetime in the given timezone name (e.g. 'America/Toronto')."""
+	return datetime.now(_zone(tz_name))
 
 
 def to_iso(dt: datetime) -> str:
@@ -4,19 +4,33 @@ This module provides lightweight input validation used by route handlers.
 If you need stronger guarantees, replace these with project-specific rules.
 """
 from typing import Any
-import regex as re
+import unicodedata
 
 
 # Allow: any Unicode letter/mark/number, spaces, plus a small, explicit set of name punctuation
 # For extra protection against things like sql injection, although the code should be safe without this
-VALID_NAME_RE = re.compile(r"^[\p{L}\p{M}\p{N} .'\-`’·]+$", flags=re.UNICODE)
+NAME_PUNCTUATION = frozenset(" .'-`’·")
+
+# Characters already known to be allowed. Starts with the punctuation and
+# grows with each new letter/mark/number seen, so the usual name is checked
+# with one set comparison and unicodedata is only consulted for characters
+# not seen before. Only allowed characters are added, so it stays bounded.
+_name_chars: set[str] = set(NAME_PUNCTUATION)
+
+
+def _is_name_char(ch: str) -> bool:
+	# General categories L*, M*, N*: what \p{L}\p{M}\p{N} matched
+	if unicodedata.category(ch)[0] in "LMN":
+		_name_chars.add(ch)
+		return True
+	return False
 
 
 def is_valid_name(s: str) -> bool:
 	"""Return True if `s` is a reasonable name for players/games.
 
 	- Strips and enforces a sensible maximum length.
-	- Uses Unicode-aware character class matching.
+	- Accepts Unicode letters, marks and numbers plus `NAME_PUNCTUATION`.
 	"""
 	if not s:
 		return False
@@ -25,11 +39,16 @@ def is_valid_name(s: str) -> bool:
 	s = s.strip()
 	if len(s) == 0 or len(s) > 200:
 		return False
-	return bool(VALID_NAME_RE.match(s))
+	if _name_chars.issuperset(s):
+		return True
+	return all(_is_name_char(ch) for ch in set(s).difference(_name_chars))
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
 
 
 def sanitize_json(obj: Any, *, _depth: int = 0, _max_depth: int = 10) -> Any:
-	"""Recursively sanitize an input JSON-like structure.
+	"""Sanitize an input JSON-like structure.
 
 	- Rejects keys that start with '$' or contain '..' (basic prototype
 	  pollution protection).
@@ -38,21 +57,34 @@ def sanitize_json(obj: Any, *, _depth: int = 0, _max_depth: int = 10) -> Any:
 	"""
 	if _depth > _max_depth:
 		raise ValueError("Input too deeply nested")
-
-	if isinstance(obj, dict):
-		clean = {}
-		for k, v in obj.items():
-			if not isinstance(k, str):
-				continue
-			if k.startswith("$") or ".." in k:
-				continue
-			clean[k] = sanitize_json(v, _depth=_depth + 1, _max_depth=_max_depth)
-		return clean
-	elif isinstance(obj, list):
-		return [sanitize_json(v, _depth=_depth + 1, _max_depth=_max_depth) for v in obj]
-	elif isinstance(obj, (str, int, float, bool)) or obj is None:
+	if isinstance(obj, _JSON_SCALARS):
 		return obj
-	else:
-		# Unknown types are rejected
-		raise ValueError("Unsupported JSON value type")
 
+	# Walk containers with an explicit stack: each one is copied with a
+	# comprehension and only nested containers are pushed, so leaves cost a
+	# type check rather than a call.
+	root = [None]
+	stack = [(root, 0, obj, _depth)]
+	while stack:
+		parent, key, value, depth = stack.pop()
+		if isinstance(value, dict):
+			clean = {
+				k: v for k, v in value.items()
+				if isinstance(k, str) and not (k.startswith("$") or ".." in k)
+			}
+			children = clean.items()
+		elif isinstance(value, list):
+			clean = list(value)
+			children = enumerate(clean)
+		else:
+			# Unknown types are rejected
+			raise ValueError("Unsupported JSON value type")
+		parent[key] = clean
+
+		depth += 1
+		for k, v in children:
+			if depth > _max_depth:
+				raise ValueError("Input too deeply nested")
+			if not isinstance(v, _JSON_SCALARS):
+				stack.append((clean, k, v, depth))
+	return root[0]
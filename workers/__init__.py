@@ -27,20 +27,24 @@ def __getattr__(name):
     elif name in (
         "repopulate_unused_game_ids",
         "run_turn",
+        "dispatch_due_turns",
         "start_game",
         "clear_stale_leases",
         "delete_expired_session_tokens",
         "delete_stale_games",
         "delete_stale_players",
+        "delete_stale_all",
     ):
         from .tasks import (
             repopulate_unused_game_ids,
             run_turn,
+            dispatch_due_turns,
             start_game,
             clear_stale_leases,
             delete_expired_session_tokens,
             delete_stale_games,
             delete_stale_players,
+            delete_stale_all,
         )
         return locals()[name]
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -50,9 +54,11 @@ __all__ = [
     "tasks",
     "repopulate_unused_game_ids",
     "run_turn",
+    "dispatch_due_turns",
     "start_game",
     "clear_stale_leases",
     "delete_expired_session_tokens",
     "delete_stale_games",
     "delete_stale_players",
+    "delete_stale_all",
 ]
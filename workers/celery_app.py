@@ -42,6 +42,15 @@ app.config_from_object({
     "enable_utc": True,
     "task_acks_late": True,
     "worker_prefetch_multiplier": 1,
+    # With late acks, a task whose worker process died goes back on the queue
+    "task_reject_on_worker_lost": True,
+    # Reuse broker connections across publishes (dispatch_due_turns fans out a
+    # batch of run_turn per tick) and keep idle Redis sockets alive rather than
+    # reconnecting after the network drops them.
+    "broker_pool_limit": 50,
+    "broker_connection_timeout": 4,
+    "redis_socket_keepalive": True,
+    "result_backend_transport_options": {"socket_keepalive": True, "socket_timeout": 5},
 })
 
 # Define queues
@@ -62,10 +71,18 @@ app.conf.task_queues = (
         routing_key="game_turns",
         queue_arguments={"x-max-priority": 10},
     ),
+    # Maintenance is split so the slow stale-data deletes can't sit in front of
+    # the quick lease/pool/session jobs; each can get its own worker pool.
     Queue(
-        "maintenance",
+        "maintenance_heavy",
         exchange=maintenance_exchange,
-        routing_key="maintenance",
+        routing_key="maintenance_heavy",
+        queue_arguments={"x-max-priority": 10},
+    ),
+    Queue(
+        "maintenance_light",
+        exchange=maintenance_exchange,
+        routing_key="maintenance_light",
         queue_arguments={"x-max-priority": 10},
     ),
 )
@@ -87,11 +104,22 @@ app.conf.sqlalchemy_session_options = {}
 
 # Periodic task schedules (Celery Beat)
 app.conf.beat_schedule = {
+    # Turns are scheduled in the due_turns table; this enqueues the due ones.
+    # The interval bounds how late a turn can start.
+    "dispatch-due-turns": {
+        "task": "workers.tasks.dispatch_due_turns",
+        "schedule": 10.0,  # Every 10 seconds
+        "options": {
+            "queue": "game_turns",
+            "priority": 1,
+        },
+    },
     "repopulate-unused-game-ids": {
         "task": "workers.tasks.repopulate_unused_game_ids",
         "schedule": crontab(minute=0, hour="*/6"),  # Every 6 hours
+        "kwargs": {"clear_leases": True},  # overlapped with the initial count
         "options": {
-            "queue": "maintenance",
+            "queue": "maintenance_light",
             "priority": 2,  # Low priority
         },
     },
@@ -99,7 +127,7 @@ app.conf.beat_schedule = {
         "task": "workers.tasks.clear_stale_leases",
         "schedule": crontab(minute=0, hour="*"),  # Every hour
         "options": {
-            "queue": "maintenance",
+            "queue": "maintenance_light",
             "priority": 2,
         },
     },
@@ -107,23 +135,39 @@ app.conf.beat_schedule = {
         "task": "workers.tasks.delete_expired_session_tokens",
         "schedule": crontab(minute=0, hour=0),  # Every 24 hours
         "options": {
-            "queue": "maintenance",
+            "queue": "maintenance_light",
             "priority": 2,
         },
     },
+    # Stale games and players are deleted together, games first; the
+    # separate delete_stale_games / delete_stale_players tasks remain for manual use.
+    "delete-stale-all": {
+        "task": "workers.tasks.delete_stale_all",
+        "schedule": crontab(minute=0, hour="*/48"),  # Every 48 hours
+        "options": {
+            "queue": "maintenance_heavy",
+            "priority": 2,
+        },
+    },
+    # Retired entries, superseded by delete-stale-all. The DatabaseScheduler only
+    # creates/updates rows, never deletes them, so a preserved
+    # celery_beat_schedule.db still has these; listing them with enabled=False
+    # switches the stored rows off (and keeps them off the retired queue).
     "delete-stale-games": {
         "task": "workers.tasks.delete_stale_games",
-        "schedule": crontab(minute=0, hour="*/48"),  # Every 48 hours
+        "schedule": crontab(minute=0, hour="*/48"),
+        "enabled": False,
         "options": {
-            "queue": "maintenance",
+            "queue": "maintenance_heavy",
             "priority": 2,
         },
     },
     "delete-stale-players": {
         "task": "workers.tasks.delete_stale_players",
-        "schedule": crontab(minute=0, hour="*/48"),  # Every 48 hours
+        "schedule": crontab(minute=0, hour="*/48"),
+        "enabled": False,
         "options": {
-            "queue": "maintenance",
+            "queue": "maintenance_heavy",
             "priority": 2,
         },
     },
@@ -140,9 +184,9 @@ logger = logging.getLogger(__name__)
 # asyncio event loop context issues - the connection is created in one context but used
 # in another, causing hangs/timeouts.
 #
-# Instead, stores are initialized lazily on first use within each task's event loop,
-# or accessed via module-level singletons that are initialized when needed.
-# See: stores/__init__.py init_stores() which handles this gracefully.
+# Instead, each worker process opens them on its own long-lived event loop at
+# worker_process_init, and tasks run every store call on that loop.
+# See: workers/loop.py.
 
 # Tasks are already imported in workers/__init__.py to avoid circular recursion
 # No need to import them again here
@@ -0,0 +1,120 @@
+"""Event loop shared by every task in a worker process.
+
+Tasks are synchronous but the stores are async. Rather than building and
+tearing down a loop with `asyncio.run()` on every call, each worker process
+runs one loop in a daemon thread for its whole life and tasks submit
+coroutines to it with `run_async`. Store connections, the auth store's write
+queue and anything else bound to a loop therefore survive across tasks.
+
+The stores are opened on that loop once per process, at worker_process_init,
+and tasks read them through `game_store()` / `auth_store()`.
+"""
+import asyncio
+import logging
+import os
+import threading
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+import config
+import stores
+
+# uvloop's C event loop cuts per-await overhead; the stdlib loop is the fallback
+# where it isn't installed (e.g. Windows dev machines).
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_pid: int | None = None
+_loop_lock = threading.Lock()
+
+_game_store = None
+_auth_store = None
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's loop, starting it on first use.
+
+    The pid check covers forked pool children: a loop thread started in the
+    parent does not exist in the child, so the child starts its own.
+    """
+    global _loop, _loop_pid
+    if _loop is not None and _loop_pid == os.getpid():
+        return _loop
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid():
+            # Only this thread's loop changes; the global loop policy is untouched
+            loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="worker-loop", daemon=True).start()
+            _loop, _loop_pid = loop, os.getpid()
+            logger.info(f"[WORKER] Started event loop thread in process {_loop_pid}")
+    return _loop
+
+
+def run_async(coro, timeout: float | None = None):
+    """Run `coro` on the process loop and block until it finishes.
+
+    If the wait ends early (timeout, or the task's soft time limit firing in
+    this thread) the coroutine is cancelled rather than left running.
+    """
+    fut = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return fut.result(timeout)
+    except BaseException:
+        fut.cancel()
+        raise
+
+
+def _open_stores() -> None:
+    global _game_store, _auth_store
+    # init_stores_async is idempotent, so a second caller just waits for the first
+    run_async(stores.init_stores_async(config.DB_PATH))
+    _game_store, _auth_store = stores.game_store, stores.auth_store
+
+
+def game_store():
+    """This process's game store, opened on the process loop."""
+    if _game_store is None:
+        _open_stores()
+    return _game_store
+
+
+def auth_store():
+    """This process's auth store, opened on the process loop."""
+    if _auth_store is None:
+        _open_stores()
+    return _auth_store
+
+
+async def _close_stores(open_stores) -> None:
+    await asyncio.gather(*(s.close() for s in open_stores))
+
+
+@worker_process_init.connect
+def _start_process_loop(**kwargs):
+    get_loop()
+    try:
+        _open_stores()
+    except Exception:
+        # Tasks retry the open on first use; don't take the pool child down
+        logger.exception("[WORKER] Failed to open stores at process init")
+
+
+@worker_process_shutdown.connect
+def _stop_process_loop(**kwargs):
+    global _loop, _game_store, _auth_store
+    if _loop is None or _loop_pid != os.getpid():
+        return
+    open_stores = [s for s in (_game_store, _auth_store) if s is not None]
+    _game_store = _auth_store = None
+    if open_stores:
+        try:
+            run_async(_close_stores(open_stores), timeout=10.0)
+        except Exception:
+            logger.exception("[WORKER] Failed to close stores at process shutdown")
+    loop, _loop = _loop, None
+    loop.call_soon_threadsafe(loop.stop)
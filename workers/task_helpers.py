@@ -1,11 +1,19 @@
 
 import random
 
+ADJECTIVES = ("Swift", "Brave", "Clever", "Mighty", "Nimble", "Fierce", "Wise", "Bold", "Loyal", "Gentle")
+NOUNS = ("Lion", "Eagle", "Wolf", "Tiger", "Dragon", "Phoenix", "Bear", "Shark", "Falcon", "Panther")
+
 def createGenericGameName():
-    adjectives = ["Swift", "Brave", "Clever", "Mighty", "Nimble", "Fierce", "Wise", "Bold", "Loyal", "Gentle"]
-    nouns = ["Lion", "Eagle", "Wolf", "Tiger", "Dragon", "Phoenix", "Bear", "Shark", "Falcon", "Panther"]
-    suffix = str(random.randint(100, 999))
-    adjective = random.choice(adjectives)
-    adjectivetwo = random.choice(adjectives)
-    noun = random.choice(nouns)
-    return f"{adjective} {adjectivetwo} {noun} {suffix}"
\ No newline at end of file
+    adjective, adjectivetwo = random.choices(ADJECTIVES, k=2)
+    noun = random.choice(NOUNS)
+    suffix = str(random.randrange(100, 1000))
+    return f"{adjective} {adjectivetwo} {noun} {suffix}"
+
+def createGenericGameNames(n):
+    """Return up to `n` distinct names from createGenericGameName."""
+    n = min(n, len(ADJECTIVES) ** 2 * len(NOUNS) * 900)
+    names = set()
+    while len(names) < n:
+        names.update(createGenericGameName() for _ in range(n - len(names)))
+    return list(names)
\ No newline at end of file
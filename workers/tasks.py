@@ -6,9 +6,11 @@ from datetime import datetime, UTC
 from typing import Any, Dict
 import asyncio
 from functools import wraps
-import stores
-from .task_helpers import createGenericGameName
+from types import MappingProxyType
+import redis
+from .task_helpers import createGenericGameNames
 from workers.celery_app import app
+from workers.loop import run_async, game_store, auth_store
 from stores import (
 	GameNotFound,
 	TurnMismatch,
@@ -25,6 +27,56 @@ hard_time_limit = 180  # seconds
 heavy_task_soft_time_limit = 120  # seconds
 heavy_task_hard_time_limit = 300  # seconds
 
+# routes.games imports this module, so routes can't be imported at load time.
+# Resolved on first use and kept for the life of the process.
+_games_helpers = None
+
+
+def _get_games_helpers():
+    global _games_helpers
+    if _games_helpers is None:
+        from routes import games_helpers
+        _games_helpers = games_helpers
+    return _games_helpers
+
+
+async def _gather(*aws):
+    # asyncio.gather returns a future, which run_async can't submit directly
+    return await asyncio.gather(*aws)
+
+
+_lock_client = None
+
+
+def _acquire_task_lock(task):
+    """Take the single-instance lock for `task`.
+
+    Returns the held lock, False if another instance holds it, or None when
+    locking isn't available (non-Redis broker, Redis unreachable); the task
+    then runs unlocked, which is safe since maintenance work is idempotent.
+    """
+    global _lock_client
+    if _lock_client is None:
+        url = app.conf.broker_url or ""
+        if not url.startswith(("redis://", "rediss://")):
+            return None
+        _lock_client = redis.Redis.from_url(url)
+    # Expire with the hard time limit so a killed worker can't hold it forever
+    lock = _lock_client.lock(f"celery:lock:{task.name}", timeout=task.time_limit or hard_time_limit)
+    try:
+        return lock if lock.acquire(blocking=False) else False
+    except redis.RedisError as exc:
+        logger.warning("Could not take lock for %s, running unlocked: %s", task.name, exc)
+        return None
+
+
+def _release_task_lock(lock) -> None:
+    try:
+        lock.release()
+    except redis.RedisError as exc:
+        # LockError (expired or taken over) included; nothing left to undo
+        logger.warning("Could not release task lock %s: %s", lock.name, exc)
+
 
 
 
@@ -42,21 +94,36 @@ def celery_task(**task_kwargs):
 		@celery_task(bind=True, queue="game_turns", ...)
 		def my_task(self, ...):
 			# business logic
+
+	Pass `base=` to pick a retry policy other than GameServerTask's, and
+	`single_instance=True` to skip a run while another instance of the same
+	task still holds its Redis lock (requires bind=True).
 	"""
+	single_instance = task_kwargs.pop("single_instance", False)
 	def decorator(func):
 		@wraps(func)
 		def wrapper(self, *args, **kwargs):
+			lock = _acquire_task_lock(self) if single_instance else None
+			if lock is False:
+				logger.info("%s is already running, skipping", func.__name__)
+				return {
+					"status": "skipped",
+					"reason": "already running",
+					"timestamp": datetime.now(UTC).isoformat(),
+				}
 			try:
 				return func(self, *args, **kwargs)
 			except SoftTimeLimitExceeded:
-				logger.warning(f"{func.__name__} exceeded soft time limit, graceful shutdown")
+				logger.warning("%s exceeded soft time limit, graceful shutdown", func.__name__)
 				raise
 			except Exception as exc:
 				# Check if exception is retryable (default to True for unknown exceptions)
 				is_retryable = getattr(exc, 'retryable', True)
 				
 				if not is_retryable:
-					logger.error(f"{func.__name__} failed with non-retryable error: {exc.__class__.__name__}: {exc}", exc_info=True)
+					# Expected outcomes (stale turn, deleted game); the type and
+					# message say it all, so skip formatting a traceback
+					logger.warning("%s failed with non-retryable error: %s: %s", func.__name__, exc.__class__.__name__, exc)
 					# Return graceful failure dict instead of raising (prevents Celery retry)
 					return {
 						"status": "failure",
@@ -65,10 +132,14 @@ def celery_task(**task_kwargs):
 						"timestamp": datetime.now(UTC).isoformat(),
 					}
 				else:
-					logger.error(f"{func.__name__} failed with retryable error: {exc.__class__.__name__}: {exc}", exc_info=True)
+					logger.error("%s failed with retryable error: %s: %s", func.__name__, exc.__class__.__name__, exc, exc_info=True)
 					raise
+			finally:
+				if lock:
+					_release_task_lock(lock)
 		# Register as Celery task with error handling
-		return app.task(base=GameServerTask, **task_kwargs)(wrapper)
+		task_kwargs.setdefault("base", GameServerTask)
+		return app.task(**task_kwargs)(wrapper)
 	return decorator
 
 
@@ -84,14 +155,14 @@ class GameServerTask(Task):
     def on_retry(self, exc: Exception, task_id: str, args: tuple, kwargs: dict, einfo: Any) -> None:
         """Log retry events."""
         logger.warning(
-            f"Task {self.name} (id={task_id}) retrying after {exc}",
+            "Task %s (id=%s) retrying after %s", self.name, task_id, exc,
             extra={"task_id": task_id, "task_args": args, "task_kwargs": kwargs},
         )
     
     def on_failure(self, exc: Exception, task_id: str, args: tuple, kwargs: dict, einfo: Any) -> None:
         """Log task failures."""
         logger.error(
-            f"Task {self.name} (id={task_id}) failed with {exc}",
+            "Task %s (id=%s) failed with %s", self.name, task_id, exc,
             extra={"task_id": task_id, "task_args": args, "task_kwargs": kwargs},
             exc_info=einfo,
         )
@@ -99,100 +170,149 @@ class GameServerTask(Task):
     def on_success(self, result: Any, task_id: str, args: tuple, kwargs: dict) -> None:
         """Log task successes."""
         logger.info(
-            f"Task {self.name} (id={task_id}) succeeded",
+            "Task %s (id=%s) succeeded", self.name, task_id,
             extra={"task_id": task_id, "task_result": result},
         )
 
 
-@celery_task(
-    bind=True,
-    name="workers.tasks.repopulate_unused_game_ids",
-    queue="maintenance",
-    priority=2,
-    soft_time_limit=soft_time_limit,
-    time_limit=hard_time_limit,
-)
-def repopulate_unused_game_ids(self, gameNamesTarget = 200) -> Dict[str, Any]:
+class HeavyGameTask(GameServerTask):
+    """Turn processing: retry quickly and give up sooner, since a turn that
+    waits an hour for its retry is as bad as a failed one."""
+
+    retry_kwargs = {"max_retries": 5}
+    retry_backoff = 2
+    retry_backoff_max = 60
+
+
+class MaintenanceTask(GameServerTask):
+    """Periodic housekeeping: back off long and retry little; the next beat
+    run does the same work anyway."""
+
+    retry_kwargs = {"max_retries": 3}
+    retry_backoff = 60
+    retry_backoff_max = 7200
+
+
+# Options shared by each family of maintenance tasks, spread into @celery_task
+# next to the task name. Read-only so no one task can drift from the rest.
+MAINT_LIGHT_OPTS = MappingProxyType({
+    "bind": True,
+    "base": MaintenanceTask,
+    "single_instance": True,
+    "queue": "maintenance_light",
+    "priority": 2,
+    "soft_time_limit": soft_time_limit,
+    "time_limit": hard_time_limit,
+})
+
+MAINT_HEAVY_OPTS = MappingProxyType({
+    **MAINT_LIGHT_OPTS,
+    "queue": "maintenance_heavy",
+    "soft_time_limit": heavy_task_soft_time_limit,
+    "time_limit": heavy_task_hard_time_limit,
+})
+
+
+@celery_task(name="workers.tasks.repopulate_unused_game_ids", **MAINT_LIGHT_OPTS)
+def repopulate_unused_game_ids(self, gameNamesTarget = 200, clear_leases: bool = False) -> Dict[str, Any]:
     """
     Periodic task to refresh unused game IDs (every 6 hours).
     
     Args:
         gameNamesTarget: minimum number of unused game IDs to maintain (default 200)
+        clear_leases: also clear expired leases, overlapped with the initial check
     
     Returns:
         dict: {
             "status": "success" | "partial_failure" | "failure",
             "refreshed_count": int,
             "added_count": int,
-            "current_count": int,
+            "current_count": int (when at_target, the target: a lower bound, not counted),
+            "at_target": bool,
+            "cleared_count": int (only when clear_leases),
             "errors": list[str] (optional),
         }
     """
-    logger.info(f"Starting repopulate_unused_game_ids task (target={gameNamesTarget})")
-
-    try:
-        gs = stores.get_game_store()
-    except RuntimeError:
-        raise RuntimeError("stores not initialized in worker")
-
-    # 1. Get count of current unused game IDs
-    current_count = asyncio.run(gs.count_unused_game_ids())
-    logger.info(f"Current unused game IDs: {current_count}")
+    logger.debug("Starting repopulate_unused_game_ids task (target=%s)", gameNamesTarget)
+
+    gs = game_store()
+
+    # 1. Check whether the pool already holds the target. This stops at the
+    # target'th row instead of counting the whole pool. Expired leases already
+    # count as free, so clearing them alongside doesn't change the answer.
+    cleared_count = None
+    if clear_leases:
+        enough, cleared_count = run_async(_gather(
+            gs.has_at_least_unused_game_ids(gameNamesTarget),
+            gs.clear_stale_leases(),
+        ))
+        logger.info("Cleared %s stale leases", cleared_count)
+    else:
+        enough = run_async(gs.has_at_least_unused_game_ids(gameNamesTarget))
     
+    # At target the pool isn't counted; the probe proves it holds at least that many
+    current_count = gameNamesTarget
     refreshed_count = 0
     added_count = 0
     errors = []
 
     # 2. If below threshold, generate new names
-    if current_count < gameNamesTarget:
+    if not enough:
+        # Pool is smaller than the target here, so the exact count is cheap
+        current_count = run_async(gs.count_unused_game_ids())
+        logger.info("Current unused game IDs: %s", current_count)
         needed = gameNamesTarget - current_count
-        logger.info(f"Below target: generating {needed} new game names")
+        logger.info("Below target: generating %s new game names", needed)
         
-        new_names = []
         try:
-            for _ in range(needed):
-                new_name = createGenericGameName()
-                new_names.append(new_name)
-            
-            # 3. Add them to the unused pool
-            inserted = asyncio.run(gs.add_unused_game_ids(new_names))
-            added_count = inserted
-            logger.info(f"Added {inserted} new game IDs to pool")
+            # 3. Add them to the unused pool in one bulk insert. Names already
+            # used by a game or already pooled are skipped, so top up the gap
+            # a few times rather than looping until it is filled.
+            for _ in range(3):
+                new_names = createGenericGameNames(needed - added_count)
+                added_count += run_async(gs.add_unused_game_ids(new_names))
+                if added_count >= needed:
+                    break
+            logger.info("Added %s new game IDs to pool", added_count)
             
         except Exception as exc:
-            logger.error(f"Failed to generate or add game names: {exc}", exc_info=True)
+            logger.error("Failed to generate or add game names: %s", exc, exc_info=True)
             errors.append(f"name generation/insertion: {str(exc)}")
     else:
-        logger.info(f"At or above target ({current_count} >= {gameNamesTarget}), no generation needed")
+        logger.info("At or above target (%s), no generation needed", gameNamesTarget)
     
-    # Get final count
-    final_count = asyncio.run(gs.count_unused_game_ids())
+    # Final count follows from the insert; no second COUNT(*) round-trip
+    final_count = current_count + added_count
     
     result = {
         "status": "success",
         "refreshed_count": refreshed_count,
         "added_count": added_count,
         "current_count": final_count,
+        "at_target": enough,
         "timestamp": datetime.now(UTC).isoformat(),
     }
+    if cleared_count is not None:
+        result["cleared_count"] = cleared_count
     
     if errors:
         result["errors"] = errors
         result["status"] = "partial_failure"
     
-    logger.info(f"repopulate_unused_game_ids task completed: {result}")
+    logger.debug("repopulate_unused_game_ids task completed: %s", result)
     return result
 
 
 @celery_task(
     bind=True,
     name="workers.tasks.run_turn",
+    base=HeavyGameTask,
     queue="game_turns",
     priority=1,
     soft_time_limit=heavy_task_soft_time_limit,
     time_limit=heavy_task_hard_time_limit,
 )
-def run_turn(self, game_id: str, turn_number: int, scheduled_at: str | None = None) -> Dict[str, Any]:
+def run_turn(self, game_id: str, turn_number: int, scheduled_at: int | None = None) -> Dict[str, Any]:
     """
     Process a game turn for `game_id` and `turn_number`.
     
@@ -201,7 +321,7 @@ def run_turn(self, game_id: str, turn_number: int, scheduled_at: str | None = No
     Args:
         game_id: ID of the game to run a turn for
         turn_number: Turn number being processed (for logging/tracking)
-        scheduled_at: ISO timestamp when this turn was scheduled (optional)
+        scheduled_at: unix seconds when this turn was scheduled (optional)
     
     Returns:
         dict: Result from run_game helper with status, state changes, etc.
@@ -213,41 +333,92 @@ def run_turn(self, game_id: str, turn_number: int, scheduled_at: str | None = No
         SimulationError: if physics simulation fails
         UnexpectedResult: if unexpected error occurs
     """
-    logger.info(f"run_turn called for game_id={game_id} turn_number={turn_number}")
+    logger.debug("run_turn called for game_id=%s turn_number=%s", game_id, turn_number)
     
-    try:
-        gs = stores.get_game_store()
-    except RuntimeError:
-        raise RuntimeError("stores not initialized in worker")
+    gs = game_store()
     
-    # Import here to avoid circular imports
-    from routes import games_helpers
+    games_helpers = _get_games_helpers()
     
     # Run the turn using the game helper
     # Pass turn_number so store can verify this is the expected turn (catches stale scheduled tasks)
-    result = asyncio.run(games_helpers.apply_moves_and_run_game(
+    result = run_async(games_helpers.apply_moves_and_run_game(
         store=gs,
         game_id=game_id,
         turn_number=turn_number,
     ))
     
     result["turn_number"] = turn_number
-    if scheduled_at:
+    if scheduled_at is not None:
         result["scheduled_at"] = scheduled_at
     
-    logger.info(f"run_turn completed for game_id={game_id}: {result}")
+    logger.info("run_turn completed for game_id=%s", game_id, extra={"result_status": result.get("status")})
+    logger.debug("run_turn result for game_id=%s: %s", game_id, result)
     return result
 
 
+@celery_task(
+    bind=True,
+    name="workers.tasks.dispatch_due_turns",
+    base=MaintenanceTask,
+    queue="game_turns",
+    priority=1,
+    soft_time_limit=soft_time_limit,
+    time_limit=hard_time_limit,
+)
+def dispatch_due_turns(self) -> Dict[str, Any]:
+    """
+    Periodic task that enqueues `run_turn` for every scheduled turn that is due.
+
+    start_game / advance_turn_if_ready record each game's next turn in the
+    `due_turns` table inside their own transaction, so scheduling never
+    depends on the broker being reachable from the request path. Turns are
+    claimed before enqueueing and only removed once enqueued; a claim left
+    behind by a crashed dispatcher is retried after `reclaim_after` seconds.
+    A duplicate run_turn is harmless: the store rejects a stale turn number.
+
+    Returns:
+        dict: {
+            "status": "success",
+            "dispatched": int,
+            "timestamp": str,
+        }
+    """
+    gs = game_store()
+
+    due = run_async(gs.claim_due_turns())
+    dispatched = []
+    # One producer (one broker connection/channel) for the whole sweep instead
+    # of acquiring one from the pool for every message.
+    with app.producer_or_acquire() as producer:
+        for game_id, turn_number in due:
+            try:
+                run_turn.apply_async(args=[game_id, turn_number], producer=producer)
+            except Exception as exc:
+                # Leave it claimed; it is handed out again once the claim goes stale
+                logger.error("Failed to enqueue run_turn for %s turn %s: %s", game_id, turn_number, exc)
+                continue
+            dispatched.append((game_id, turn_number))
+    run_async(gs.complete_due_turns(dispatched))
+
+    if dispatched:
+        logger.info("dispatch_due_turns enqueued %s turns", len(dispatched))
+    return {
+        "status": "success",
+        "dispatched": len(dispatched),
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
 @celery_task(
     bind=True,
     name="workers.tasks.start_game",
+    base=HeavyGameTask,
     queue="game_management",
     priority=1,
     soft_time_limit=soft_time_limit,
     time_limit=hard_time_limit,
 )
-def start_game(self, game_id: str, *, scheduled_at: str | None = None) -> Dict[str, Any]:
+def start_game(self, game_id: str, *, scheduled_at: int | None = None) -> Dict[str, Any]:
     """
     Start the specified game.
     
@@ -256,65 +427,44 @@ def start_game(self, game_id: str, *, scheduled_at: str | None = None) -> Dict[s
     
     Args:
         game_id: ID of the game to start
-        scheduled_at: ISO timestamp when this start was scheduled (optional)
+        scheduled_at: unix seconds when this start was scheduled (optional)
     
     Returns:
         dict: Result from start_game helper with status, initial state, etc.
     """
-    logger.info(f"start_game called for game_id={game_id}")
+    logger.debug("start_game called for game_id=%s", game_id)
     owner_id = "system"  # Reserved name for system-triggered starts
     
-    try:
-        gs = stores.get_game_store()
-    except RuntimeError:
-        raise RuntimeError("stores not initialized in worker")
-    
-    # Import here to avoid circular imports
-    from routes import games_helpers
-
-    # Combined async operation to avoid multiple asyncio.run() calls
-    # and to apply a timeout to the entire operation
-    async def combined_start_game():
-        """Start game in a single event loop with timeout."""
-        # Start the game with a timeout
-        try:
-            result = await asyncio.wait_for(
-                games_helpers.start_game(
-                    store=gs,
-                    game_id=game_id,
-                    owner_id=owner_id,
-                ),
-                timeout=45.0
-            )
-            return result
-        except asyncio.TimeoutError:
-            logger.error("start_game timed out after 45s for game_id=%s", game_id)
-            raise RuntimeError(f"start_game helper timeout for {game_id}")
-        except Exception:
-            logger.exception("start_game helper raised exception for game_id=%s", game_id)
-            raise
+    gs = game_store()
     
+    games_helpers = _get_games_helpers()
+
+    # Apply a timeout to the entire operation on the worker's loop
     try:
-        result = asyncio.run(combined_start_game())
+        result = run_async(asyncio.wait_for(
+            games_helpers.start_game(
+                store=gs,
+                game_id=game_id,
+                owner_id=owner_id,
+            ),
+            timeout=45.0,
+        ))
+    except asyncio.TimeoutError:
+        logger.error("start_game timed out after 45s for game_id=%s", game_id)
+        raise RuntimeError(f"start_game helper timeout for {game_id}")
     except Exception:
-        logger.exception("Combined start_game operation failed for game_id=%s", game_id)
+        logger.exception("start_game helper raised exception for game_id=%s", game_id)
         raise
     
-    if scheduled_at:
+    if scheduled_at is not None:
         result["scheduled_at"] = scheduled_at
     
-    logger.info(f"start_game completed for game_id={game_id}: {result}")
+    logger.info("start_game completed for game_id=%s", game_id, extra={"result_status": result.get("status")})
+    logger.debug("start_game result for game_id=%s: %s", game_id, result)
     return result
 
 
-@celery_task(
-    bind=True,
-    name="workers.tasks.clear_stale_leases",
-    queue="maintenance",
-    priority=2,
-    soft_time_limit=soft_time_limit,
-    time_limit=hard_time_limit,
-)
+@celery_task(name="workers.tasks.clear_stale_leases", **MAINT_LIGHT_OPTS)
 def clear_stale_leases(self) -> Dict[str, Any]:
     """
     Periodic task to clear stale leases on unused game IDs.
@@ -331,16 +481,13 @@ def clear_stale_leases(self) -> Dict[str, Any]:
             "errors": list[str] (optional),
         }
     """
-    logger.info("Starting clear_stale_leases task")
+    logger.debug("Starting clear_stale_leases task")
 
-    try:
-        gs = stores.get_game_store()
-    except RuntimeError:
-        raise RuntimeError("stores not initialized in worker")
+    gs = game_store()
 
     # Clear all expired leases
-    cleared_count = asyncio.run(gs.clear_stale_leases())
-    logger.info(f"Cleared {cleared_count} stale leases")
+    cleared_count = run_async(gs.clear_stale_leases())
+    logger.info("Cleared %s stale leases", cleared_count)
     
     result = {
         "status": "success",
@@ -348,18 +495,11 @@ def clear_stale_leases(self) -> Dict[str, Any]:
         "timestamp": datetime.now(UTC).isoformat(),
     }
     
-    logger.info(f"clear_stale_leases task completed: {result}")
+    logger.debug("clear_stale_leases task completed: %s", result)
     return result
 
 
-@celery_task(
-    bind=True,
-    name="workers.tasks.delete_expired_session_tokens",
-    queue="maintenance",
-    priority=2,
-    soft_time_limit=soft_time_limit,
-    time_limit=hard_time_limit,
-)
+@celery_task(name="workers.tasks.delete_expired_session_tokens", **MAINT_LIGHT_OPTS)
 def delete_expired_session_tokens(self, inactivity_hours: int = 48) -> Dict[str, Any]:
     """
     Periodic task to delete expired session tokens.
@@ -375,16 +515,13 @@ def delete_expired_session_tokens(self, inactivity_hours: int = 48) -> Dict[str,
             "timestamp": str,
         }
     """
-    logger.info("Starting delete_expired_session_tokens task")
+    logger.debug("Starting delete_expired_session_tokens task")
 
-    try:
-        au = stores.get_auth_store()
-    except RuntimeError:
-        raise RuntimeError("stores not initialized in worker")
+    au = auth_store()
 
     # Delete all expired sessions from the database
-    deleted_count = asyncio.run(au.delete_expired_sessions())
-    logger.info(f"Deleted {deleted_count} expired session tokens")
+    deleted_count = run_async(au.delete_expired_sessions())
+    logger.info("Deleted %s expired session tokens", deleted_count)
     
     result = {
         "status": "success",
@@ -392,18 +529,11 @@ def delete_expired_session_tokens(self, inactivity_hours: int = 48) -> Dict[str,
         "timestamp": datetime.now(UTC).isoformat(),
     }
     
-    logger.info(f"delete_expired_session_tokens task completed: {result}")
+    logger.debug("delete_expired_session_tokens task completed: %s", result)
     return result
 
 
-@celery_task(
-    bind=True,
-    name="workers.tasks.delete_stale_games",
-    queue="maintenance",
-    priority=2,
-    soft_time_limit=heavy_task_soft_time_limit,
-    time_limit=heavy_task_hard_time_limit,
-)
+@celery_task(name="workers.tasks.delete_stale_games", **MAINT_HEAVY_OPTS)
 def delete_stale_games(self, inactivity_days: int = 30) -> Dict[str, Any]:
     """
     Periodic task to delete games not accessed for a prolonged period.
@@ -418,16 +548,13 @@ def delete_stale_games(self, inactivity_days: int = 30) -> Dict[str, Any]:
             "timestamp": str,
         }
     """
-    logger.info(f"Starting delete_stale_games task (inactivity_days={inactivity_days})")
+    logger.debug("Starting delete_stale_games task (inactivity_days=%s)", inactivity_days)
 
-    try:
-        gs = stores.get_game_store()
-    except RuntimeError:
-        raise RuntimeError("stores not initialized in worker")
+    gs = game_store()
 
     # Delete all stale games from the database
-    deleted_count = asyncio.run(gs.delete_stale_games(inactivity_days))
-    logger.info(f"Deleted {deleted_count} stale games")
+    deleted_count = run_async(gs.delete_stale_games(inactivity_days))
+    logger.info("Deleted %s stale games", deleted_count)
     
     result = {
         "status": "success",
@@ -436,18 +563,11 @@ def delete_stale_games(self, inactivity_days: int = 30) -> Dict[str, Any]:
         "timestamp": datetime.now(UTC).isoformat(),
     }
     
-    logger.info(f"delete_stale_games task completed: {result}")
+    logger.debug("delete_stale_games task completed: %s", result)
     return result
 
 
-@celery_task(
-    bind=True,
-    name="workers.tasks.delete_stale_players",
-    queue="maintenance",
-    priority=2,
-    soft_time_limit=heavy_task_soft_time_limit,
-    time_limit=heavy_task_hard_time_limit,
-)
+@celery_task(name="workers.tasks.delete_stale_players", **MAINT_HEAVY_OPTS)
 def delete_stale_players(self, inactivity_days: int = 30) -> Dict[str, Any]:
     """
     Periodic task to delete orphaned players older than a threshold.
@@ -465,16 +585,13 @@ def delete_stale_players(self, inactivity_days: int = 30) -> Dict[str, Any]:
             "timestamp": str,
         }
     """
-    logger.info(f"Starting delete_stale_players task (inactivity_days={inactivity_days})")
+    logger.debug("Starting delete_stale_players task (inactivity_days=%s)", inactivity_days)
 
-    try:
-        gs = stores.get_game_store()
-    except RuntimeError:
-        raise RuntimeError("stores not initialized in worker")
+    gs = game_store()
 
     # Delete all stale players from the database
-    deleted_count = asyncio.run(gs.delete_stale_players(inactivity_days))
-    logger.info(f"Deleted {deleted_count} stale players")
+    deleted_count = run_async(gs.delete_stale_players(inactivity_days))
+    logger.info("Deleted %s stale players", deleted_count)
     
     result = {
         "status": "success",
@@ -483,5 +600,43 @@ def delete_stale_players(self, inactivity_days: int = 30) -> Dict[str, Any]:
         "timestamp": datetime.now(UTC).isoformat(),
     }
     
-    logger.info(f"delete_stale_players task completed: {result}")
+    logger.debug("delete_stale_players task completed: %s", result)
+    return result
+
+
+@celery_task(name="workers.tasks.delete_stale_all", **MAINT_HEAVY_OPTS)
+def delete_stale_all(self, inactivity_days: int = 30) -> Dict[str, Any]:
+    """
+    Periodic task combining delete_stale_games and delete_stale_players.
+    
+    Games are deleted first, so players orphaned by a deleted game are removed
+    in the same pass.
+    
+    Args:
+        inactivity_days: number of days of inactivity before deletion (default 30)
+    
+    Returns:
+        dict: {
+            "status": "success" | "failure",
+            "games_deleted": int,
+            "players_deleted": int,
+            "timestamp": str,
+        }
+    """
+    logger.debug("Starting delete_stale_all task (inactivity_days=%s)", inactivity_days)
+
+    gs = game_store()
+
+    games_deleted, players_deleted = run_async(gs.delete_stale_games_and_players(inactivity_days))
+    logger.info("Deleted %s stale games and %s stale players", games_deleted, players_deleted)
+    
+    result = {
+        "status": "success",
+        "games_deleted": games_deleted,
+        "players_deleted": players_deleted,
+        "inactivity_days": inactivity_days,
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+    
+    logger.debug("delete_stale_all task completed: %s", result)
     return result